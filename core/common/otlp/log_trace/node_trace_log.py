@@ -1,4 +1,5 @@
 import json
+import sys
 import time
 import uuid
 from typing import Any, Dict, List, Optional
@@ -96,8 +97,6 @@ class NodeTraceLog(BaseModel):
         :return:
         """
 
-        import sys
-
         def is_large_string(s: str, limit: int = 5 * 1024) -> bool:
             return isinstance(s, str) and sys.getsizeof(s.encode("utf-8")) > limit
 
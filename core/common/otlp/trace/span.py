@@ -1,3 +1,4 @@
+import functools
 import inspect
 import json
 import os
@@ -17,12 +18,22 @@ if TYPE_CHECKING:
 from common.otlp import sid as sid_module
 from common.otlp.log_trace.node_log import NodeLog
 from common.otlp.trace.trace import SpanLevel
+from common.otlp.trace.trace import Trace as CTrace
 
 # from xf_langflow.otlp.log_trace.node_log import NodeLog
 
 SPAN_SIZE_LIMIT = 10 * 1024
 
 
+@functools.lru_cache(maxsize=None)
+def _get_tracer(service_name: str) -> trace.Tracer:
+    """
+    按服务名缓存 tracer，避免每次创建 Span 都重新获取
+    在 TracerProvider 设置前获取的是代理 tracer，设置后会自动委托给真实 tracer
+    """
+    return trace.get_tracer(service_name)
+
+
 class Span:
     sid: str
     app_id: str
@@ -42,7 +53,7 @@ class Span:
         if sid_module.sid_generator2 is None:
             raise Exception("sid_generator2 is not initialized")
         self.sid = sid_module.sid_generator2.gen()
-        self.tracer = trace.get_tracer(os.getenv("SERVICE_NAME", "service_trace"))
+        self.tracer = _get_tracer(os.getenv("SERVICE_NAME", "service_trace"))
         self.oss_service = oss_service
 
     @contextmanager
@@ -77,8 +88,6 @@ class Span:
 
         context = None
         if trace_context:
-            from common.otlp.trace.trace import Trace as CTrace
-
             context = CTrace.extract_context(trace_context)
 
         with self.tracer.start_as_current_span(
@@ -1,6 +1,8 @@
 import os
 from typing import Optional
 
+from loguru import logger
+
 from common.service.base import ServiceFactory
 from common.service.kafka.kafka_service import KafkaProducerService
 
@@ -26,5 +28,32 @@ class KafkaProducerServiceFactory(ServiceFactory):
         if enable and not servers:
             raise ValueError("KAFKA_SERVERS 环境变量未配置")
 
-        config = {"bootstrap.servers": servers, **kwargs}
+        config: dict = {"bootstrap.servers": servers}
+        # 可选的生产者调优：攒批等待时间、批大小、压缩方式与确认级别，
+        # 未配置时沿用 librdkafka 默认值
+        linger_ms = _int_env("KAFKA_LINGER_MS")
+        if linger_ms is not None:
+            config["linger.ms"] = linger_ms
+        batch_size = _int_env("KAFKA_BATCH_SIZE")
+        if batch_size is not None:
+            config["batch.size"] = batch_size
+        compression_type = os.getenv("KAFKA_COMPRESSION_TYPE")
+        if compression_type:
+            config["compression.type"] = compression_type
+        acks = os.getenv("KAFKA_ACKS")
+        if acks:
+            config["acks"] = acks
+        config.update(kwargs)
         return KafkaProducerService(config)
+
+
+def _int_env(name: str) -> Optional[int]:
+    """读取整数型环境变量，未配置或格式错误时返回 None"""
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"{name}={value!r} 不是整数，已忽略")
+        return None
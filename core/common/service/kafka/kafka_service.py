@@ -1,5 +1,5 @@
 import os
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 from confluent_kafka import Producer  # type: ignore[import-untyped]
 from loguru import logger
@@ -52,6 +52,52 @@ class KafkaProducerService(Service):
             logger.error(f"Kafka message send failed: {e}")
             raise e
 
+    def send_batch(
+        self,
+        topic: str,
+        values: List[str],
+        callback: Optional[Any] = None,
+        timeout: Optional[int] = None,
+    ) -> None:
+        """
+        批量发送 Kafka 消息，所有消息入队后只 poll 一次
+        :param topic: Kafka topic
+        :param values: 消息内容列表（已序列化的 JSON 字符串）
+        :param callback: 回调函数
+        :param timeout: poll timeout (秒)
+        """
+        if os.getenv("KAFKA_ENABLE", "false").lower() not in (
+            "true",
+            "1",
+            "yes",
+            "on",
+        ):
+            return
+
+        if not timeout:
+            timeout = int(os.getenv("KAFKA_TIMEOUT", 10))
+
+        if not callback:
+            callback = self._delivery_report
+        try:
+            for value in values:
+                try:
+                    self.producer.produce(topic=topic, value=value, callback=callback)
+                except BufferError:
+                    # 本地队列已满：先处理已完成的投递腾出空间，再重试一次，
+                    # 仍失败则丢弃该条，不影响批内其余消息
+                    self.producer.poll(0)
+                    try:
+                        self.producer.produce(
+                            topic=topic, value=value, callback=callback
+                        )
+                    except BufferError:
+                        logger.error("Kafka local queue full, message dropped")
+            self.producer.poll(timeout)
+        except Exception as e:
+            logger.error(f"Kafka batch send failed: {e}")
+            raise e
+
     def _delivery_report(self, err: Any, msg: Any) -> None:
         """
         消息发送回调函数
@@ -6,7 +6,7 @@ tool listing and tool execution requests and responses.
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 # MCPToolList Request and Response
@@ -126,3 +126,51 @@ class MCPCallToolResponse(BaseModel):
     message: str
     sid: str
     data: MCPCallToolData
+
+
+# MCPBatchCallTool Request and Response
+class MCPBatchCallToolRequest(BaseModel):
+    """Request model for executing several MCP tool calls at once.
+
+    Calls to the same server share one session and run concurrently, up to
+    ``max_concurrent`` calls at a time. With ``stop_on_error`` set, calls not
+    yet started when one fails are skipped. A batch holds at most 64 calls.
+    """
+
+    calls: list[MCPCallToolRequest] = Field(max_length=64)
+    max_concurrent: int = Field(default=8, ge=1, le=64)
+    stop_on_error: bool = False
+
+
+class MCPBatchCallToolItem(BaseModel):
+    """Result of a single call within a batch.
+
+    Carries its own code and message so one failed call does not fail
+    the whole batch.
+    """
+
+    code: int
+    message: str
+    data: MCPCallToolData
+
+
+class MCPBatchCallToolData(BaseModel):
+    """Data payload for MCP batch tool execution response.
+
+    Contains one result per requested call, in request order.
+    """
+
+    results: list[MCPBatchCallToolItem]
+
+
+class MCPBatchCallToolResponse(BaseModel):
+    """Complete response for MCP batch tool execution requests.
+
+    Standard API response format with code, message, session ID,
+    and the per-call results.
+    """
+
+    code: int
+    message: str
+    sid: str
+    data: MCPBatchCallToolData
@@ -4,30 +4,58 @@ This module provides API endpoints for interacting with MCP tools,
 including listing available tools and calling specific MCP tool functions.
 """
 
-from fastapi import APIRouter, Body
+from fastapi import APIRouter, Body, Response
 from plugin.link.api.schemas.community.tools.mcp.mcp_tools_schema import (
+    MCPBatchCallToolRequest,
+    MCPBatchCallToolResponse,
     MCPCallToolRequest,
     MCPCallToolResponse,
     MCPToolListRequest,
     MCPToolListResponse,
 )
-from plugin.link.service.community.tools.mcp.mcp_server import call_tool, tool_list
+from plugin.link.service.community.tools.mcp.mcp_server import (
+    batch_call_tool,
+    call_tool,
+    tool_list,
+)
 
 # MCP tools router
 mcp_router = APIRouter(tags=["mcp tools api"])
 
 
-@mcp_router.post("/mcp/tool_list", response_model_exclude_none=True)
-async def tool_list_api(list_info: MCPToolListRequest = Body()) -> MCPToolListResponse:
+@mcp_router.post(
+    "/mcp/tool_list",
+    response_model=MCPToolListResponse,
+    response_model_exclude_none=True,
+)
+async def tool_list_api(list_info: MCPToolListRequest = Body()) -> Response:
     """
     Call MCP tool's tool list
     """
     return await tool_list(list_info=list_info)
 
 
-@mcp_router.post("/mcp/call_tool", response_model_exclude_none=True)
-async def call_tool_api(call_info: MCPCallToolRequest = Body()) -> MCPCallToolResponse:
+@mcp_router.post(
+    "/mcp/call_tool",
+    response_model=MCPCallToolResponse,
+    response_model_exclude_none=True,
+)
+async def call_tool_api(call_info: MCPCallToolRequest = Body()) -> Response:
     """
     Call MCP tool's call tool
     """
     return await call_tool(call_info=call_info)
+
+
+@mcp_router.post(
+    "/mcp/batch_call_tool",
+    response_model=MCPBatchCallToolResponse,
+    response_model_exclude_none=True,
+)
+async def batch_call_tool_api(
+    batch_info: MCPBatchCallToolRequest = Body(),
+) -> Response:
+    """
+    Call several MCP tools in one request
+    """
+    return await batch_call_tool(batch_info=batch_info)
@@ -1,6 +1,8 @@
 import functools
 import os
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator
 
 import uvicorn
 from common.initialize.initialize import initialize_services
@@ -10,6 +12,8 @@ from loguru import logger
 from plugin.link.api.router import router
 from plugin.link.consts import const
 from plugin.link.domain.models.manager import init_data_base
+from plugin.link.service.community.tools.http.telemetry_batcher import telemetry_batcher
+from plugin.link.service.community.tools.mcp.session_pool import mcp_session_pool
 from plugin.link.utils.json_schemas.read_json_schemas import (
     load_create_tool_schema,
     load_http_run_schema,
@@ -119,6 +123,14 @@ class SparkLinkServer:
         uvicorn_server.run()
 
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Close pooled MCP sessions and flush queued telemetry on shutdown."""
+    yield
+    await mcp_session_pool.close()
+    await telemetry_batcher.close()
+
+
 def spark_link_app() -> FastAPI:
     """
     Create Spark Link app.
@@ -140,7 +152,7 @@ def spark_link_app() -> FastAPI:
     load_tool_debug_schema()
     load_mcp_register_schema()
     spark_link_init_sid()
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app.include_router(router)
     logger.error("init success")
     return app
@@ -0,0 +1,76 @@
+"""Environment variable keys used by the Spark Link service.
+
+Every key is re-exported by ``plugin.link.consts.const``.
+"""
+
+# Common general configuration
+# Blacklist configuration
+SEGMENT_BLACK_LIST_KEY = "SEGMENT_BLACK_LIST"
+IP_BLACK_LIST_KEY = "IP_BLACK_LIST"
+DOMAIN_BLACK_LIST_KEY = "DOMAIN_BLACK_LIST"
+# Distinguish between official and third-party tools
+OFFICIAL_TOOL_KEY = "OFFICIAL_TOOL"
+THIRD_TOOL_KEY = "THIRD_TOOL"
+# Official default app ID
+DEFAULT_APPID_KEY = "DEFAULT_APPID"
+# ID generation
+DATACENTER_ID_KEY = "DATACENTER_ID"
+WORKER_ID_KEY = "WORKER_ID"
+
+HTTP_AUTH_QU_APP_ID_KEY = "HTTP_AUTH_QU_APP_ID"
+HTTP_AUTH_QU_APP_KEY_KEY = "HTTP_AUTH_QU_APP_KEY"
+HTTP_AUTH_AWAU_APP_ID_KEY = "HTTP_AUTH_AWAU_APP_ID"
+HTTP_AUTH_AWAU_API_KEY_KEY = "HTTP_AUTH_AWAU_API_KEY"
+HTTP_AUTH_AWAU_API_SECRET_KEY = "HTTP_AUTH_AWAU_API_SECRET"
+
+# xingchen-utils
+SERVICE_NAME_KEY = "SERVICE_NAME"
+OTLP_ENABLE_KEY = "OTLP_ENABLE"
+OTLP_DC_KEY = "OTLP_DC"
+OTLP_SERVICE_NAME_KEY = "OTLP_SERVICE_NAME"
+
+SERVICE_SUB_KEY = "SERVICE_SUB"
+SERVICE_LOCATION_KEY = "SERVICE_LOCATION"
+
+KAFKA_TOPIC_KEY = "KAFKA_TOPIC"
+
+# MCP client sessions
+MCP_SESSION_READ_TIMEOUT_KEY = "MCP_SESSION_READ_TIMEOUT"
+
+# Response schema validation
+FAST_SCHEMA_VALIDATION_KEY = "FAST_SCHEMA_VALIDATION"
+
+# MySQL configuration
+MYSQL_HOST_KEY = "MYSQL_HOST"
+MYSQL_PORT_KEY = "MYSQL_PORT"
+MYSQL_USER_KEY = "MYSQL_USER"
+MYSQL_PASSWORD_KEY = "MYSQL_PASSWORD"
+MYSQL_DB_KEY = "MYSQL_DB"
+
+# Redis configuration
+REDIS_CLUSTER_ADDR_KEY = "REDIS_CLUSTER_ADDR"
+REDIS_ADDR_KEY = "REDIS_ADDR"
+REDIS_PASSWORD_KEY = "REDIS_PASSWORD"
+REDIS_EXPIRE_KEY = "REDIS_EXPIRE"
+
+# Spark link log configuration
+LOG_LEVEL_KEY = "LOG_LEVEL"
+LOG_PATH_KEY = "LOG_PATH"
+
+PROJECT_NAME_KEY = "PROJECT_NAME"
+VERSION_KEY = "VERSION"
+CONFIG_FILE_KEY = "CONFIG_FILE"
+ENVIRONMENT_KEY = "ENVIRONMENT"
+
+POLARIS_URL_KEY = "POLARIS_URL"
+POLARIS_CLUSTER_KEY = "POLARIS_CLUSTER"
+POLARIS_USERNAME_KEY = "POLARIS_USERNAME"
+POLARIS_PASSWORD_KEY = "POLARIS_PASSWORD"
+
+# uvicorn
+SERVICE_PORT_KEY = "SERVICE_PORT"
+
+# Every key above, by constant name
+KEYS: dict[str, str] = {
+    name: value for name, value in globals().items() if name.endswith("_KEY")
+}
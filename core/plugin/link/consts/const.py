@@ -1,143 +1,142 @@
 """Constants module for Spark Link service.
 
 Contains all configuration constants, environment variables, and key mappings used
-throughout the Spark Link service. Constants are imported from various key modules
-and used by other modules via attribute access (e.g., const.service_name_key).
+throughout the Spark Link service. Key constants are defined in the single
+``_keys_table`` module and used by other modules via attribute access
+(e.g., const.SERVICE_NAME_KEY).
 """
 
+import functools
 import os
+import sys
+from typing import Final, Optional
 
-# common
-# pylint: disable=unused-import  # These imports are used via module attribute access
-from plugin.link.consts.keys.common_keys import (
+# pylint: disable=unused-import  # Re-exported for const.<NAME>_KEY access
+from plugin.link.consts._keys_table import (
+    CONFIG_FILE_KEY,
     DATACENTER_ID_KEY,
     DEFAULT_APPID_KEY,
     DOMAIN_BLACK_LIST_KEY,
+    ENVIRONMENT_KEY,
+    FAST_SCHEMA_VALIDATION_KEY,
     HTTP_AUTH_AWAU_API_KEY_KEY,
     HTTP_AUTH_AWAU_API_SECRET_KEY,
     HTTP_AUTH_AWAU_APP_ID_KEY,
     HTTP_AUTH_QU_APP_ID_KEY,
     HTTP_AUTH_QU_APP_KEY_KEY,
     IP_BLACK_LIST_KEY,
-    OFFICIAL_TOOL_KEY,
-    SEGMENT_BLACK_LIST_KEY,
-    THIRD_TOOL_KEY,
-    WORKER_ID_KEY,
-)
-
-# mysql
-# pylint: disable=unused-import  # These imports are used via module attribute access
-from plugin.link.consts.keys.mysql_keys import (
+    KAFKA_TOPIC_KEY,
+    KEYS,
+    LOG_LEVEL_KEY,
+    LOG_PATH_KEY,
+    MCP_SESSION_READ_TIMEOUT_KEY,
     MYSQL_DB_KEY,
     MYSQL_HOST_KEY,
     MYSQL_PASSWORD_KEY,
     MYSQL_PORT_KEY,
     MYSQL_USER_KEY,
-)
-
-# redis
-# pylint: disable=unused-import  # These imports are used via module attribute access
-from plugin.link.consts.keys.redis_keys import (
-    REDIS_ADDR_KEY,
-    REDIS_CLUSTER_ADDR_KEY,
-    REDIS_PASSWORD_KEY,
-)
-
-# spark
-# pylint: disable=unused-import  # These imports are used via module attribute access
-from plugin.link.consts.keys.spark_keys import (
-    CONFIG_FILE_KEY,
-    ENVIRONMENT_KEY,
-    LOG_LEVEL_KEY,
-    LOG_PATH_KEY,
+    OFFICIAL_TOOL_KEY,
+    OTLP_DC_KEY,
+    OTLP_ENABLE_KEY,
+    OTLP_SERVICE_NAME_KEY,
     POLARIS_CLUSTER_KEY,
     POLARIS_PASSWORD_KEY,
     POLARIS_URL_KEY,
     POLARIS_USERNAME_KEY,
     PROJECT_NAME_KEY,
-    VERSION_KEY,
-)
-
-# uvicorn
-from plugin.link.consts.keys.uvicorn_keys import SERVICE_PORT_KEY
-
-# common
-# These imports are used via module attribute access
-from plugin.link.consts.keys.xc_utils_keys import (  # SERVICE_PORT_KEY,
-    KAFKA_THREAD_NUM_KEY,
-    KAFKA_TOPIC_KEY,
-    OTLP_DC_KEY,
-    OTLP_ENABLE_KEY,
-    OTLP_SERVICE_NAME_KEY,
+    REDIS_ADDR_KEY,
+    REDIS_CLUSTER_ADDR_KEY,
+    REDIS_EXPIRE_KEY,
+    REDIS_PASSWORD_KEY,
+    SEGMENT_BLACK_LIST_KEY,
     SERVICE_LOCATION_KEY,
     SERVICE_NAME_KEY,
+    SERVICE_PORT_KEY,
     SERVICE_SUB_KEY,
+    THIRD_TOOL_KEY,
+    VERSION_KEY,
+    WORKER_ID_KEY,
 )
 
+# Cached environment variable lookups, keyed by variable name
+_ENV_CACHE: dict[str, str] = {}
+
+
+def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Return the value of an environment variable, caching it once set.
+
+    Environment variables do not change after service start, so callers on
+    hot paths should use this instead of reading ``os.environ`` per request.
+    Unset variables are not cached, so a value loaded later (e.g. from
+    Polaris during startup) is still picked up.
+    """
+    value = _ENV_CACHE.get(key)
+    if value is None:
+        value = os.environ.get(key)
+        if value is None:
+            return default
+        _ENV_CACHE[key] = value
+    return value
+
+
 # Environment variables
-Env = os.getenv(ENVIRONMENT_KEY)
-ENV_PRODUCTION = "production"
-ENV_PRERELEASE = "prerelease"
-ENV_DEVELOPMENT = "development"
-
-# Runtime environment constants
-DevelopmentEnv = "development"
-ProductionEnv = "production"
-
-# Keeping XingchenEnviron to match existing usage pattern
-XingchenEnviron = (
-    ProductionEnv if Env in (ENV_PRODUCTION, ENV_PRERELEASE) else DevelopmentEnv
-)
+Env = get_env(ENVIRONMENT_KEY)
+ENV_PRODUCTION: Final[str] = sys.intern("production")
+ENV_PRERELEASE: Final[str] = sys.intern("prerelease")
+ENV_DEVELOPMENT: Final[str] = sys.intern("development")
+# Environments that run with production behaviour
+PROD_LIKE_ENVS: Final[frozenset[str]] = frozenset({ENV_PRODUCTION, ENV_PRERELEASE})
+
+# Runtime environment constants (interned so equality checks hit the
+# identity fast path)
+DevelopmentEnv: Final[str] = sys.intern("development")
+ProductionEnv: Final[str] = sys.intern("production")
+
+
+@functools.lru_cache(maxsize=1)
+def is_production_env() -> bool:
+    """Return whether the service runs in a production-like environment.
+
+    Reads ENVIRONMENT through ``get_env``, the same source as IS_PRODUCTION,
+    and memoizes the answer on first call; use ``cache_clear()`` if the
+    environment changes at runtime.
+    """
+    return get_env(ENVIRONMENT_KEY) in PROD_LIKE_ENVS
+
+
+@functools.lru_cache(maxsize=1)
+def is_otlp_enabled() -> bool:
+    """Return whether OTLP telemetry reporting is enabled.
+
+    Resolved on first call rather than at import, so configuration pulled
+    into the environment during startup (e.g. from Polaris) is honoured.
+    """
+    return get_env(OTLP_ENABLE_KEY, "0") == "1"
+
+
+@functools.lru_cache(maxsize=1)
+def is_fast_schema_validation_enabled() -> bool:
+    """Return whether responses are pre-checked with compiled schema validators.
+
+    Enabled unless FAST_SCHEMA_VALIDATION is set to "0", which keeps every
+    response on the jsonschema validator.
+    """
+    return get_env(FAST_SCHEMA_VALIDATION_KEY, "1") != "0"
+
+
+# Prefer branching on IS_PRODUCTION; XingchenEnviron is kept for existing callers
+IS_PRODUCTION: Final[bool] = Env in PROD_LIKE_ENVS
+XingchenEnviron = ProductionEnv if IS_PRODUCTION else DevelopmentEnv
 
 # Default tool version and deletion flag value
-DEF_VER = "V1.0"
-DEF_DEL = 0
-
-__all__ = [
-    # common_keys
-    "DATACENTER_ID_KEY",
-    "DEFAULT_APPID_KEY",
-    "DOMAIN_BLACK_LIST_KEY",
-    "HTTP_AUTH_AWAU_API_KEY_KEY",
-    "HTTP_AUTH_AWAU_API_SECRET_KEY",
-    "HTTP_AUTH_AWAU_APP_ID_KEY",
-    "HTTP_AUTH_QU_APP_ID_KEY",
-    "HTTP_AUTH_QU_APP_KEY_KEY",
-    "IP_BLACK_LIST_KEY",
-    "OFFICIAL_TOOL_KEY",
-    "SEGMENT_BLACK_LIST_KEY",
-    "THIRD_TOOL_KEY",
-    "WORKER_ID_KEY",
-    # xc_utils_keys
-    "SERVICE_NAME_KEY",
-    "SERVICE_SUB_KEY",
-    "SERVICE_LOCATION_KEY",
-    "OTLP_ENABLE_KEY",
-    "OTLP_DC_KEY",
-    "OTLP_SERVICE_NAME_KEY",
-    "KAFKA_TOPIC_KEY",
-    "KAFKA_THREAD_NUM_KEY",
-    # mysql_keys
-    "MYSQL_DB_KEY",
-    "MYSQL_HOST_KEY",
-    "MYSQL_PASSWORD_KEY",
-    "MYSQL_PORT_KEY",
-    "MYSQL_USER_KEY",
-    # redis_keys
-    "REDIS_ADDR_KEY",
-    "REDIS_CLUSTER_ADDR_KEY",
-    "REDIS_PASSWORD_KEY",
-    # spark_keys
-    "CONFIG_FILE_KEY",
-    "ENVIRONMENT_KEY",
-    "LOG_LEVEL_KEY",
-    "LOG_PATH_KEY",
-    "POLARIS_CLUSTER_KEY",
-    "POLARIS_PASSWORD_KEY",
-    "POLARIS_URL_KEY",
-    "POLARIS_USERNAME_KEY",
-    "PROJECT_NAME_KEY",
-    "VERSION_KEY",
-    # uvicorn_keys
-    "SERVICE_PORT_KEY",
-]
+DEF_VER: Final[str] = sys.intern("V1.0")
+DEF_DEL: Final[int] = 0
+
+__all__ = (
+    "IS_PRODUCTION",
+    "PROD_LIKE_ENVS",
+    "get_env",
+    "is_fast_schema_validation_enabled",
+    "is_otlp_enabled",
+    "is_production_env",
+) + tuple(KEYS)
@@ -1,7 +0,0 @@
-# MySQL configuration
-
-MYSQL_HOST_KEY = "MYSQL_HOST"
-MYSQL_PORT_KEY = "MYSQL_PORT"
-MYSQL_USER_KEY = "MYSQL_USER"
-MYSQL_PASSWORD_KEY = "MYSQL_PASSWORD"
-MYSQL_DB_KEY = "MYSQL_DB"
@@ -1,6 +0,0 @@
-# Redis configuration
-
-REDIS_CLUSTER_ADDR_KEY = "REDIS_CLUSTER_ADDR"
-REDIS_ADDR_KEY = "REDIS_ADDR"
-REDIS_PASSWORD_KEY = "REDIS_PASSWORD"
-REDIS_EXPIRE_KEY = "REDIS_EXPIRE"
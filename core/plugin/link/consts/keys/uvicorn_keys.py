@@ -1,2 +0,0 @@
-# uvicorn keys
-SERVICE_PORT_KEY = "SERVICE_PORT"
@@ -20,6 +20,7 @@ from plugin.link.consts import const
 from plugin.link.domain.models.manager import get_db_engine
 from plugin.link.exceptions.sparklink_exceptions import SparkLinkBaseException
 from plugin.link.infra.tool_crud.process import ToolCrudOperation
+from plugin.link.service.community.tools.http.schema_cache import invalidate_tool_schema
 from plugin.link.utils.errors.code import ErrCode
 from plugin.link.utils.json_schemas.read_json_schemas import (
     get_create_tool_schema,
@@ -417,6 +418,8 @@ def delete_tools(
             # Delete tools
             crud_inst = ToolCrudOperation(get_db_engine())
             crud_inst.delete_tools(tool_info)
+            for tool_id in tool_ids:
+                invalidate_tool_schema(tool_id, const.DEF_VER)
 
             _send_success_telemetry(meter, node_trace, ErrCode.SUCCESSES.msg)
             return ToolManagerResponse(
@@ -510,6 +513,8 @@ def update_tools(tools_info: ToolManagerRequest) -> ToolManagerResponse:
         # Update tools in database
         crud_inst = ToolCrudOperation(get_db_engine())
         crud_inst.update_tools(update_tool)
+        for tool_id in tool_ids:
+            invalidate_tool_schema(tool_id)
 
         _send_success_telemetry(meter, node_trace, ErrCode.SUCCESSES.msg, tool_ids)
         return ToolManagerResponse(
@@ -5,19 +5,31 @@ HTTP request execution, tool debugging, and OpenAPI schema validation.
 It handles authentication, parameter validation, and response processing.
 """
 
-import asyncio
-import atexit
 import base64
+import functools
 import json
-import os
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
+import fastjsonschema
+import orjson
 from common.otlp.log_trace.node_trace_log import NodeTraceLog, Status
 from common.otlp.metrics.meter import Meter
 from common.otlp.trace.span import Span
-from common.service import get_kafka_producer_service
+from jsonschema import Draft7Validator
 from loguru import logger
 from opentelemetry.trace import Status as OTelStatus
 from opentelemetry.trace import StatusCode
@@ -34,6 +46,12 @@ from plugin.link.domain.models.manager import get_db_engine
 from plugin.link.exceptions.sparklink_exceptions import SparkLinkBaseException
 from plugin.link.infra.tool_crud.process import ToolCrudOperation
 from plugin.link.infra.tool_exector.process import HttpRun
+from plugin.link.service.community.tools.http.schema_cache import (
+    ToolSchemaEntry,
+    get_cached_tool_schema,
+    set_cached_tool_schema,
+)
+from plugin.link.service.community.tools.http.telemetry_batcher import telemetry_batcher
 from plugin.link.utils.errors.code import ErrCode
 from plugin.link.utils.json_schemas.read_json_schemas import (
     get_http_run_schema,
@@ -42,21 +60,20 @@ from plugin.link.utils.json_schemas.read_json_schemas import (
 from plugin.link.utils.json_schemas.schema_validate import api_validate
 from plugin.link.utils.open_api_schema.schema_parser import OpenapiSchemaParser
 from plugin.link.utils.uid.generate_uid import new_uid
-
-try:
-    max_workers = int(os.getenv(const.KAFKA_THREAD_NUM_KEY, "10"))
-except Exception:
-    max_workers = 10
-kafka_send_executor = ThreadPoolExecutor(max_workers=max_workers)
-atexit.register(kafka_send_executor.shutdown, wait=True)
-
-default_value = {
-    " 'string'": "",
-    " 'number'": 0,
-    " 'object'": {},
-    " 'array'": [],
-    " 'boolean'": False,
-    " 'integer'": 0,
+from pydantic import BaseModel
+
+# Shared read-only fallback for requests without a header
+EMPTY_HEADER: Mapping[str, Any] = MappingProxyType({})
+
+# Defaults substituted for null response fields, keyed by JSON schema type.
+# Each entry is a factory so mutable defaults are never shared between fields.
+NULL_DEFAULT_FACTORIES: Dict[str, Callable[[], Any]] = {
+    "string": str,
+    "number": int,
+    "object": dict,
+    "array": list,
+    "boolean": bool,
+    "integer": int,
 }
 
 
@@ -64,90 +81,94 @@ def extract_request_params(
     run_params_list: Dict[str, Any],
 ) -> Tuple[Optional[str], str, str]:
     """Extract common request parameters."""
-    app_id = (
-        run_params_list.get("header", {}).get("app_id")
-        if run_params_list.get("header", {}).get("app_id")
-        else os.getenv(const.DEFAULT_APPID_KEY)
-    )
-    uid = (
-        run_params_list.get("header", {}).get("uid")
-        if run_params_list.get("header", {}).get("uid")
-        else new_uid()
-    )
-    caller = (
-        run_params_list.get("header", {}).get("caller")
-        if run_params_list.get("header", {}).get("caller")
-        else ""
-    )
+    header = run_params_list.get("header") or EMPTY_HEADER
+    app_id = header.get("app_id") or const.get_env(const.DEFAULT_APPID_KEY)
+    uid = header.get("uid") or new_uid()
+    caller = header.get("caller") or ""
     return app_id, uid, caller
 
 
 async def send_telemetry(node_trace: NodeTraceLog) -> None:
-    """Send telemetry data to Kafka."""
-    if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
-        kafka_service = get_kafka_producer_service()
+    """Queue telemetry data for batched delivery to Kafka."""
+    if const.is_otlp_enabled():
         node_trace.start_time = int(round(time.time() * 1000))
-        loop = asyncio.get_running_loop()
-        await loop.run_in_executor(
-            kafka_send_executor,
-            kafka_service.send,
-            os.getenv(const.KAFKA_TOPIC_KEY),
-            node_trace.to_json(),
-        )
+        telemetry_batcher.submit(const.get_env(const.KAFKA_TOPIC_KEY) or "", node_trace)
 
 
-async def handle_validation_error(
-    validate_err: str, span_context: Span, node_trace: NodeTraceLog, m: Meter
-) -> HttpRunResponse:
-    """Handle validation errors with telemetry."""
-    if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
-        m.in_error_count(ErrCode.JSON_PROTOCOL_PARSER_ERR.code)
-        node_trace.answer = validate_err
-        node_trace.status = Status(
-            code=ErrCode.JSON_PROTOCOL_PARSER_ERR.code,
-            message=validate_err,
-        )
+ResponseT = TypeVar("ResponseT", HttpRunResponse, ToolDebugResponse)
+
+
+async def respond_with_telemetry(
+    code: int,
+    message: str,
+    span_context: Span,
+    node_trace_supplier: Callable[[], NodeTraceLog],
+    m: Meter,
+    *,
+    answer: Optional[str] = None,
+    tool_id: Optional[str] = None,
+    tool_type: str = "",
+    payload: Optional[Dict[str, Any]] = None,
+    response_cls: Type[ResponseT],
+    header_cls: Type[BaseModel],
+) -> ResponseT:
+    """Report the outcome of a request and build its response.
+
+    ``answer`` defaults to ``message``; ``tool_id`` is only recorded on the
+    node trace when given.
+    """
+    if const.is_otlp_enabled():
+        node_trace = node_trace_supplier()
+        if code == ErrCode.SUCCESSES.code:
+            m.in_success_count()
+        else:
+            m.in_error_count(code)
+        node_trace.answer = message if answer is None else answer
+        if tool_id is not None:
+            node_trace.service_id = tool_id
+        if tool_type:
+            node_trace.log_caller = tool_type
+        node_trace.status = Status(code=code, message=message)
         await send_telemetry(node_trace)
 
-    return HttpRunResponse(
-        header=HttpRunResponseHeader(
-            code=ErrCode.JSON_PROTOCOL_PARSER_ERR.code,
-            message=validate_err,
-            sid=span_context.sid,
+    # Every field is built here from known-good values, so skip validation
+    return response_cls.model_construct(
+        header=header_cls.model_construct(
+            code=code, message=message, sid=span_context.sid
         ),
-        payload={},
+        payload=payload or {},
+    )
+
+
+async def handle_validation_error(
+    validate_err: str,
+    span_context: Span,
+    node_trace_supplier: Callable[[], NodeTraceLog],
+    m: Meter,
+) -> HttpRunResponse:
+    """Handle validation errors with telemetry."""
+    return await respond_with_telemetry(
+        ErrCode.JSON_PROTOCOL_PARSER_ERR.code,
+        validate_err,
+        span_context,
+        node_trace_supplier,
+        m,
+        response_cls=HttpRunResponse,
+        header_cls=HttpRunResponseHeader,
     )
 
 
 async def handle_sparklink_error(
     err: SparkLinkBaseException,
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
     tool_id: str = "",
     tool_type: str = "",
 ) -> HttpRunResponse:
     """Handle SparkLink base exceptions with telemetry."""
-    span_context.add_error_event(err.message)
-    span_context.set_status(OTelStatus(StatusCode.ERROR))
-
-    if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
-        m.in_error_count(err.code)
-        node_trace.answer = err.message
-        node_trace.service_id = tool_id
-        if tool_type:
-            node_trace.log_caller = tool_type
-        node_trace.status = Status(
-            code=err.code,
-            message=err.message,
-        )
-        await send_telemetry(node_trace)
-
-    return HttpRunResponse(
-        header=HttpRunResponseHeader(
-            code=err.code, message=err.message, sid=span_context.sid
-        ),
-        payload={},
+    return await handle_custom_error(
+        err, err.message, span_context, node_trace_supplier, m, tool_id, tool_type
     )
 
 
@@ -155,7 +176,7 @@ async def handle_custom_error(
     error_code: Any,
     message: str,
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
     tool_id: str = "",
     tool_type: str = "",
@@ -163,61 +184,94 @@ async def handle_custom_error(
     """Handle custom errors with telemetry."""
     span_context.add_error_event(message)
     span_context.set_status(OTelStatus(StatusCode.ERROR))
-
-    if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
-        m.in_error_count(error_code.code)
-        node_trace.answer = message
-        node_trace.service_id = tool_id
-        if tool_type:
-            node_trace.log_caller = tool_type
-        node_trace.status = Status(
-            code=error_code.code,
-            message=message,
-        )
-        await send_telemetry(node_trace)
-
-    return HttpRunResponse(
-        header=HttpRunResponseHeader(
-            code=error_code.code,
-            message=message,
-            sid=span_context.sid,
-        ),
-        payload={},
+    return await respond_with_telemetry(
+        error_code.code,
+        message,
+        span_context,
+        node_trace_supplier,
+        m,
+        tool_id=tool_id,
+        tool_type=tool_type,
+        response_cls=HttpRunResponse,
+        header_cls=HttpRunResponseHeader,
     )
 
 
 async def handle_general_exception(
     err: Exception,
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
     tool_id: str = "",
     tool_type: str = "",
 ) -> HttpRunResponse:
     """Handle general exceptions with telemetry."""
-    span_context.add_error_event(f"{ErrCode.COMMON_ERR.msg}: {err}")
-    span_context.set_status(OTelStatus(StatusCode.ERROR))
+    return await handle_custom_error(
+        ErrCode.COMMON_ERR,
+        f"{ErrCode.COMMON_ERR.msg}: {err}",
+        span_context,
+        node_trace_supplier,
+        m,
+        tool_id,
+        tool_type,
+    )
 
-    if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
-        m.in_error_count(ErrCode.COMMON_ERR.code)
-        node_trace.answer = f"{ErrCode.COMMON_ERR.msg}: {err}"
-        node_trace.service_id = tool_id
-        if tool_type:
-            node_trace.log_caller = tool_type
-        node_trace.status = Status(
-            code=ErrCode.COMMON_ERR.code,
-            message=f"{ErrCode.COMMON_ERR.msg}: {err}",
+
+@dataclass(frozen=True, slots=True)
+class AuthPlan:
+    """Authentication resolved once per operation when its schema is parsed."""
+
+    target: Literal["header", "query", "none"] = "none"
+    name: str = ""
+    value: str = ""
+    error: Optional[str] = None
+
+
+NO_AUTH_PLAN = AuthPlan()
+
+
+def build_auth_plan(operation_id_schema: Dict[str, Any]) -> AuthPlan:
+    """Resolve where and which API key an operation sends."""
+    if not operation_id_schema.get("security"):
+        return NO_AUTH_PLAN
+
+    security_type = operation_id_schema.get("security_type")
+    if security_type not in operation_id_schema["security"]:
+        return AuthPlan(
+            error=f"Security type {security_type} not found in security schema"
         )
-        await send_telemetry(node_trace)
 
-    return HttpRunResponse(
-        header=HttpRunResponseHeader(
-            code=ErrCode.COMMON_ERR.code,
-            message=f"{ErrCode.COMMON_ERR.msg}: {err}",
-            sid=span_context.sid,
-        ),
-        payload={},
-    )
+    api_key_info = operation_id_schema["security"].get(security_type)
+    auth_name = api_key_info.get("name", None)
+    auth_value = api_key_info.get("x-value", None)
+    if not auth_name or not auth_value:
+        return AuthPlan(error=f"auth name:{auth_name}, auth value:{auth_value}")
+
+    if api_key_info.get("type") == "apiKey":
+        location = api_key_info.get("in")
+        if location == "header" or location == "query":
+            return AuthPlan(target=location, name=auth_name, value=auth_value)
+    return NO_AUTH_PLAN
+
+
+def attach_auth_plans(tool_id_schema: Dict[str, Any]) -> None:
+    """Store the resolved AuthPlan on every operation of a parsed tool schema."""
+    for operation_id in tool_id_schema.get("operation_ids", []):
+        operation_id_schema = tool_id_schema.get(operation_id)
+        if isinstance(operation_id_schema, dict):
+            operation_id_schema["_auth_plan"] = build_auth_plan(operation_id_schema)
+
+
+def attach_response_schema_keys(tool_id_schema: Dict[str, Any]) -> None:
+    """Store the validator cache key on every operation with a response schema."""
+    for operation_id in tool_id_schema.get("operation_ids", []):
+        operation_id_schema = tool_id_schema.get(operation_id)
+        if isinstance(operation_id_schema, dict):
+            response_schema = operation_id_schema.get("response_schema")
+            if isinstance(response_schema, dict):
+                operation_id_schema["_response_schema_key"] = _response_schema_key(
+                    response_schema
+                )
 
 
 def process_authentication(
@@ -227,116 +281,159 @@ def process_authentication(
     tool_id: str,
 ) -> None:
     """Process authentication for the request."""
-    if not operation_id_schema["security"]:
-        return
+    plan = operation_id_schema.get("_auth_plan")
+    if plan is None:
+        plan = build_auth_plan(operation_id_schema)
 
-    security_type = operation_id_schema["security_type"]
-    if security_type not in operation_id_schema["security"]:
-        raise Exception(f"Security type {security_type} not found in security schema")
+    if plan.error:
+        raise Exception(plan.error)
+    if plan.target == "header":
+        message_header[plan.name] = plan.value
+    elif plan.target == "query":
+        message_query[plan.name] = plan.value
 
-    api_key_info = operation_id_schema["security"].get(security_type)
-    auth_name = api_key_info.get("name", None)
-    auth_value = api_key_info.get("x-value", None)
-    if not auth_name or not auth_value:
-        raise Exception(f"auth name:{auth_name}, auth value:{auth_value}")
 
-    if api_key_info.get("type") == "apiKey":
-        api_key_dict = {auth_name: auth_value}
-        if api_key_info.get("in") == "header":
-            message_header.update(api_key_dict)
-        elif api_key_info.get("in") == "query":
-            message_query.update(api_key_dict)
+def _response_schema_key(response_schema: Dict[str, Any]) -> bytes:
+    """Canonical form of a response schema, used as the validator cache key."""
+    return orjson.dumps(response_schema, option=orjson.OPT_SORT_KEYS)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_response_validator(schema_json: bytes) -> Draft7Validator:
+    """Compile a response validator for a canonical JSON schema document."""
+    return Draft7Validator(orjson.loads(schema_json))
+
+
+@functools.lru_cache(maxsize=512)
+def _build_fast_response_check(schema_json: bytes) -> Optional[Callable[[Any], Any]]:
+    """Compile a fastjsonschema check, None when the schema is not supported.
+
+    Defaults and formats are disabled so a passing check means exactly what
+    a Draft7Validator without format checking would accept.
+    """
+    try:
+        return fastjsonschema.compile(
+            orjson.loads(schema_json), use_default=False, use_formats=False
+        )
+    except Exception as err:
+        # Besides JsonSchemaDefinitionException, patterns outside Python's re
+        # syntax (e.g. ``\p{L}``) fail here with re.error
+        logger.debug(f"fastjsonschema cannot compile response schema: {err}")
+        return None
+
+
+def get_response_validator(response_schema: Dict[str, Any]) -> Draft7Validator:
+    """Get a cached validator for the given response schema."""
+    return _build_response_validator(_response_schema_key(response_schema))
+
+
+def dumps_result(result_json: Any) -> str:
+    """Serialize a tool response to a JSON string."""
+    try:
+        return orjson.dumps(result_json).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects integers wider than 64 bits, which stdlib json keeps
+        return json.dumps(result_json, ensure_ascii=False)
+
+
+def load_result(result: str) -> Any:
+    """Parse a tool response, keeping responses that are not JSON as text."""
+    try:
+        return json.loads(result)
+    except Exception:
+        return result
+
+
+def canonicalize_result(result: str, result_json: Any, span_context: Span) -> str:
+    """Serialize the validated response, recording it on the span.
+
+    The canonical form is only recorded again when it differs from the raw
+    response, so unchanged payloads are not exported twice.
+    """
+    span_context.add_info_events({"before result": result})
+    canonical = dumps_result(result_json)
+    if canonical != result:
+        span_context.add_info_events({"after result": canonical})
+    return canonical
 
 
 def validate_response_schema(
-    result_json: Any, open_api_schema: Dict[str, Any]
+    result_json: Any,
+    open_api_schema: Optional[Dict[str, Any]],
+    response_schema: Optional[Dict[str, Any]] = None,
+    response_schema_key: Optional[bytes] = None,
 ) -> List[str]:
-    """Validate response against schema and return error messages."""
-    response_schema = get_response_schema(open_api_schema)
-    import jsonschema
+    """Validate response against schema and return error messages.
+
+    ``response_schema`` is the operation's schema resolved at parse time; when
+    it is not given the schema is looked up in the OpenAPI document.
+    ``response_schema_key`` is its precomputed validator cache key, if any.
+    """
+    schema_key = response_schema_key
+    if schema_key is None:
+        if response_schema is None:
+            response_schema = get_response_schema(open_api_schema)
+        schema_key = _response_schema_key(response_schema)
+
+    # Valid responses only need the compiled check; jsonschema is kept for
+    # collecting every error and filling null fields
+    if const.is_fast_schema_validation_enabled():
+        fast_check = _build_fast_response_check(schema_key)
+        if fast_check is not None:
+            try:
+                fast_check(result_json)
+                return []
+            except fastjsonschema.JsonSchemaValueException:
+                pass
 
-    errs = list(jsonschema.Draft7Validator(response_schema).iter_errors(result_json))
+    validator = _build_response_validator(schema_key)
+    errs = list(validator.iter_errors(result_json))
     er_msgs = []
     for err in errs:
-        err_msg = err.message
-        if err_msg.startswith("None is not of type"):
-            key_type = err_msg.split("None is not of type")[1]
-            key_type = key_type.strip("")
-            path = err.json_path
-            path_list = path.split(".")[1:]
-            path_list_len = len(path_list)
-            i = 0
-            root = result_json
-            while True:
-                if i >= path_list_len - 1:
-                    break
-                path_ = path_list[i]
-                if "[" in path_ and "]" in path_:
-                    array_name, array_index = process_array(path_)
-                    root = root.get(array_name)
-                    root = root[array_index]
-                else:
-                    root = root.get(path_)
-                i += 1
-            path_end = path_list[-1]
-            if "[" in path_end and "]" in path_end:
-                array_name, array_index = process_array(path_end)
-                if key_type in default_value:
-                    root[array_name][array_index] = default_value.get(key_type)
-                else:
-                    er_msgs.append(
-                        f"参数路径: {err.json_path}, 错误信息: {err.message}"
-                    )
-            else:
-                if key_type in default_value:
-                    root[path_end] = default_value.get(key_type)
-                else:
-                    er_msgs.append(
-                        f"参数路径: {err.json_path}, 错误信息: {err.message}"
-                    )
-        else:
-            er_msgs.append(f"参数路径: {err.json_path}, 错误信息: {err.message}")
+        if err.validator == "type" and err.instance is None and err.absolute_path:
+            # Use the schema's type, the last one when several are allowed
+            expected = err.validator_value
+            key_type = expected[-1] if isinstance(expected, list) else expected
+            default_factory = NULL_DEFAULT_FACTORIES.get(key_type)
+            if default_factory is not None:
+                *parents, last = err.absolute_path
+                root = result_json
+                for key in parents:
+                    root = root[key]
+                root[last] = default_factory()
+                continue
+        er_msgs.append(f"参数路径: {err.json_path}, 错误信息: {err.message}")
     return er_msgs
 
 
 async def handle_success_response(
     result: str,
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
     tool_id: str,
     tool_type: str,
 ) -> HttpRunResponse:
     """Handle successful response with telemetry."""
-    if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
-        m.in_success_count()
-        node_trace.answer = result
-        node_trace.service_id = tool_id
-        node_trace.log_caller = tool_type
-        node_trace.status = Status(
-            code=ErrCode.SUCCESSES.code,
-            message=ErrCode.SUCCESSES.msg,
-        )
-        await send_telemetry(node_trace)
-
-    return HttpRunResponse(
-        header=HttpRunResponseHeader(
-            code=ErrCode.SUCCESSES.code,
-            message=ErrCode.SUCCESSES.msg,
-            sid=span_context.sid,
-        ),
-        payload={
-            "text": {
-                "text": result,
-            }
-        },
+    return await respond_with_telemetry(
+        ErrCode.SUCCESSES.code,
+        ErrCode.SUCCESSES.msg,
+        span_context,
+        node_trace_supplier,
+        m,
+        answer=result,
+        tool_id=tool_id,
+        tool_type=tool_type,
+        payload={"text": {"text": result}},
+        response_cls=HttpRunResponse,
+        header_cls=HttpRunResponseHeader,
     )
 
 
 async def handle_debug_validation_error(
     validate_err: str,
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
     tool_id: str,
     tool_type: str,
@@ -346,87 +443,62 @@ async def handle_debug_validation_error(
         f"Error code: {ErrCode.JSON_PROTOCOL_PARSER_ERR.code}, "
         f"error message: {validate_err}"
     )
-
-    if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
-        m.in_error_count(ErrCode.JSON_PROTOCOL_PARSER_ERR.code)
-        node_trace.answer = validate_err
-        node_trace.service_id = tool_id
-        node_trace.log_caller = tool_type
-        node_trace.status = Status(
-            code=ErrCode.JSON_PROTOCOL_PARSER_ERR.code,
-            message=validate_err,
-        )
-        await send_telemetry(node_trace)
-
-    return HttpRunResponse(
-        header=HttpRunResponseHeader(
-            code=ErrCode.JSON_PROTOCOL_PARSER_ERR.code,
-            message=validate_err,
-            sid=span_context.sid,
-        ),
-        payload={},
+    return await respond_with_telemetry(
+        ErrCode.JSON_PROTOCOL_PARSER_ERR.code,
+        validate_err,
+        span_context,
+        node_trace_supplier,
+        m,
+        tool_id=tool_id,
+        tool_type=tool_type,
+        response_cls=HttpRunResponse,
+        header_cls=HttpRunResponseHeader,
     )
 
 
 async def handle_debug_success_response(
     result: str,
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
     tool_id: str,
     tool_type: str,
 ) -> ToolDebugResponse:
     """Handle successful debug response with telemetry."""
-    if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
-        m.in_success_count()
-        node_trace.answer = result
-        node_trace.service_id = tool_id
-        node_trace.log_caller = tool_type
-        node_trace.status = Status(
-            code=ErrCode.SUCCESSES.code,
-            message=ErrCode.SUCCESSES.msg,
-        )
-        await send_telemetry(node_trace)
-
-    return ToolDebugResponse(
-        header=ToolDebugResponseHeader(
-            code=ErrCode.SUCCESSES.code,
-            message=ErrCode.SUCCESSES.msg,
-            sid=span_context.sid,
-        ),
-        payload={
-            "text": {
-                "text": result,
-            }
-        },
+    return await respond_with_telemetry(
+        ErrCode.SUCCESSES.code,
+        ErrCode.SUCCESSES.msg,
+        span_context,
+        node_trace_supplier,
+        m,
+        answer=result,
+        tool_id=tool_id,
+        tool_type=tool_type,
+        payload={"text": {"text": result}},
+        response_cls=ToolDebugResponse,
+        header_cls=ToolDebugResponseHeader,
     )
 
 
+def _decode_message_field(data: Optional[str]) -> Dict[str, Any]:
+    """Decode a base64 encoded JSON message field, empty when absent.
+
+    Decoded with stdlib json: user payloads may carry integers wider than 64
+    bits or NaN, which orjson would turn into floats or reject.
+    """
+    return json.loads(base64.b64decode(data)) if data else {}
+
+
 def process_message_params(
     message: Dict[str, Any],
 ) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
     """Process and decode message parameters."""
-    message_header = (
-        json.loads(base64.b64decode(header_data).decode("utf-8"))
-        if (header_data := message.get("header"))
-        else {}
-    )
-    message_query = (
-        json.loads(base64.b64decode(query_data).decode("utf-8"))
-        if (query_data := message.get("query"))
-        else {}
-    )
-    path = (
-        json.loads(base64.b64decode(path_data).decode("utf-8"))
-        if (path_data := message.get("path"))
-        else {}
+    return (
+        _decode_message_field(message.get("header")),
+        _decode_message_field(message.get("query")),
+        _decode_message_field(message.get("path")),
+        _decode_message_field(message.get("body")),
     )
-    body = (
-        json.loads(base64.b64decode(body_data).decode("utf-8"))
-        if (body_data := message.get("body"))
-        else {}
-    )
-    return message_header, message_query, path, body
 
 
 def setup_http_request(
@@ -452,20 +524,20 @@ def setup_http_request(
 async def process_http_result(
     result: str,
     open_api_schema: Dict[str, Any],
+    response_schema: Optional[Dict[str, Any]],
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
     tool_id: str,
     tool_type: str,
+    response_schema_key: Optional[bytes] = None,
 ) -> HttpRunResponse:
     """Process HTTP call result and handle validation."""
-    result_json = None
-    try:
-        result_json = json.loads(result)
-    except Exception:
-        result_json = result
+    result_json = load_result(result)
 
-    er_msgs = validate_response_schema(result_json, open_api_schema)
+    er_msgs = validate_response_schema(
+        result_json, open_api_schema, response_schema, response_schema_key
+    )
     if er_msgs:
         msg = ";".join(er_msgs)
         detailed_message = (
@@ -475,58 +547,58 @@ async def process_http_result(
             ErrCode.RESPONSE_SCHEMA_VALIDATE_ERR,
             detailed_message,
             span_context,
-            node_trace,
+            node_trace_supplier,
             m,
             tool_id,
             tool_type,
         )
 
-    span_context.add_info_events({"before result": result})
-    result = json.dumps(result_json, ensure_ascii=False)
-    span_context.add_info_events({"after result": result})
+    result = canonicalize_result(result, result_json, span_context)
 
     return await handle_success_response(
-        result, span_context, node_trace, m, tool_id, tool_type
+        result, span_context, node_trace_supplier, m, tool_id, tool_type
     )
 
 
-def setup_span_and_trace(
-    run_params_list: Dict[str, Any], app_id: Optional[str], uid: str, caller: str
-) -> Tuple[Span, NodeTraceLog]:
-    """Setup span and node trace for the request."""
+def setup_span(
+    run_params_list: Dict[str, Any], app_id: Optional[str], uid: str
+) -> Span:
+    """Setup the request span, reusing the caller's sid when given."""
     span = Span(app_id=app_id, uid=uid)
-    sid = run_params_list.get("header", {}).get("sid")
+    sid = (run_params_list.get("header") or EMPTY_HEADER).get("sid")
     if sid:
         span.sid = sid
-
-    node_trace = NodeTraceLog(
-        service_id="",
-        sid=sid or "",
-        app_id=str(app_id) if app_id else "",
-        uid=str(uid) if uid else "",
-        chat_id=sid or "",
+    return span
+
+
+def node_trace_supplier_for(
+    span_context: Span, caller: str, usr_input: str, service_id: str = ""
+) -> Callable[[], NodeTraceLog]:
+    """Return a supplier that builds the request's node trace on demand.
+
+    The node trace is only built when telemetry is actually reported, so
+    requests in deployments without OTLP never allocate it.
+    """
+    return functools.partial(
+        NodeTraceLog,
+        service_id=service_id,
+        sid=span_context.sid,
+        app_id=span_context.app_id or "",
+        uid=span_context.uid or "",
+        chat_id=span_context.sid,
         sub="spark-link",
         caller=caller,
         log_caller="",
-        question=json.dumps(run_params_list, ensure_ascii=False),
+        question=usr_input,
     )
-    return span, node_trace
 
 
 def setup_logging_and_metrics(
-    span_context: Span, run_params_list: Dict[str, Any]
+    span_context: Span, run_params_list: Dict[str, Any], usr_input: str
 ) -> Meter:
     """Setup logging and metrics for the request."""
-    logger.info(
-        {
-            "exec api, http_run router usr_input": json.dumps(
-                run_params_list, ensure_ascii=False
-            )
-        }
-    )
-    span_context.add_info_events(
-        {"usr_input": json.dumps(run_params_list, ensure_ascii=False)}
-    )
+    logger.info({"exec api, http_run router usr_input": usr_input})
+    span_context.add_info_events({"usr_input": usr_input})
     span_context.set_attributes(
         attributes={
             "tool_id": str(run_params_list.get("parameter", {}).get("tool_id", {}))
@@ -535,17 +607,18 @@ def setup_logging_and_metrics(
     return Meter(app_id=span_context.app_id, func="http_run")
 
 
-def get_tool_schema(
-    run_params_list: Dict[str, Any],
-    tool_id: str,
-    operation_id: str,
-    version: str,
-    span_context: Span,
-) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[Dict[str, Any]]]:
-    """Get tool schema from database."""
+def _load_tool_schema(
+    app_id: str, tool_id: str, version: str, span_context: Span
+) -> Optional[ToolSchemaEntry]:
+    """Query a tool version and parse its OpenAPI schema, with caching."""
+    key = (app_id, tool_id, version)
+    cached = get_cached_tool_schema(key)
+    if cached is not None:
+        return cached
+
     tool_id_info = [
         {
-            "app_id": run_params_list["header"]["app_id"],
+            "app_id": app_id,
             "tool_id": tool_id,
             "version": version,
             "is_deleted": const.DEF_DEL,
@@ -555,21 +628,44 @@ def get_tool_schema(
     query_results = crud_inst.get_tools(tool_id_info, span=span_context)
 
     if not query_results:
-        return None, None, None
+        return None
+
+    # get_tools returns one row per requested tool, so only this tool is parsed
+    result_dict = query_results[-1].dict()
+    open_api_schema = json.loads(result_dict.get("open_api_schema"))
+    tool_type = (
+        const.get_env(const.OFFICIAL_TOOL_KEY)
+        if open_api_schema.get("info").get("x-is-official")
+        else const.get_env(const.THIRD_TOOL_KEY)
+    )
+    parser = OpenapiSchemaParser(open_api_schema, span=span_context)
+    tool_id_schema = parser.schema_parser()
+    if not tool_id_schema:
+        # Failed parses are not cached, so a fixed schema is picked up at once
+        return {}, tool_type, open_api_schema
+    attach_auth_plans(tool_id_schema)
+    attach_response_schema_keys(tool_id_schema)
 
-    parser_result = {}
-    for query_result in query_results:
-        result_dict = query_result.dict()
-        open_api_schema = json.loads(result_dict.get("open_api_schema"))
-        tool_type = (
-            os.getenv(const.OFFICIAL_TOOL_KEY)
-            if open_api_schema.get("info").get("x-is-official")
-            else os.getenv(const.THIRD_TOOL_KEY)
-        )
-        parser = OpenapiSchemaParser(open_api_schema, span=span_context)
-        parser_result.update({result_dict["tool_id"]: parser.schema_parser()})
+    entry: ToolSchemaEntry = (tool_id_schema, tool_type, open_api_schema)
+    set_cached_tool_schema(key, entry)
+    return entry
+
+
+def get_tool_schema(
+    run_params_list: Dict[str, Any],
+    tool_id: str,
+    operation_id: str,
+    version: str,
+    span_context: Span,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[Dict[str, Any]]]:
+    """Get tool schema from cache or database."""
+    entry = _load_tool_schema(
+        run_params_list["header"]["app_id"], tool_id, version, span_context
+    )
+    if entry is None:
+        return None, None, None
 
-    tool_id_schema = parser_result[tool_id]
+    tool_id_schema, tool_type, open_api_schema = entry
     operation_id_schema = tool_id_schema.get(operation_id, "")
 
     return operation_id_schema, tool_type, open_api_schema
@@ -578,14 +674,14 @@ def get_tool_schema(
 async def validate_and_get_params(
     run_params_list: Dict[str, Any],
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
 ) -> Tuple[Optional[Dict[str, str]], Optional[HttpRunResponse]]:
     """Validate request and extract parameters."""
     validate_err = api_validate(get_http_run_schema(), run_params_list)
     if validate_err:
         return None, await handle_validation_error(
-            validate_err, span_context, node_trace, m
+            validate_err, span_context, node_trace_supplier, m
         )
 
     tool_id = run_params_list["parameter"]["tool_id"]
@@ -605,7 +701,7 @@ async def handle_request_execution(
     run_params_list: Dict[str, Any],
     params: Dict[str, str],
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
 ) -> HttpRunResponse:
     """Handle the actual HTTP request execution."""
@@ -623,7 +719,7 @@ async def handle_request_execution(
                     ErrCode.OPENAPI_AUTH_TYPE_ERR,
                     ErrCode.OPENAPI_AUTH_TYPE_ERR.msg,
                     span_context,
-                    node_trace,
+                    node_trace_supplier,
                     m,
                     params["tool_id"],
                     tool_type,
@@ -643,20 +739,22 @@ async def handle_request_execution(
         return await process_http_result(
             result,
             open_api_schema,
+            operation_id_schema.get("response_schema"),
             span_context,
-            node_trace,
+            node_trace_supplier,
             m,
             params["tool_id"],
             tool_type,
+            operation_id_schema.get("_response_schema_key"),
         )
 
     except SparkLinkBaseException as err:
         return await handle_sparklink_error(
-            err, span_context, node_trace, m, params["tool_id"], tool_type
+            err, span_context, node_trace_supplier, m, params["tool_id"], tool_type
         )
     except Exception as err:
         return await handle_general_exception(
-            err, span_context, node_trace, m, params["tool_id"], tool_type
+            err, span_context, node_trace_supplier, m, params["tool_id"], tool_type
         )
 
 
@@ -664,7 +762,7 @@ async def execute_http_request(
     run_params_list: Dict[str, Any],
     params: Dict[str, str],
     span_context: Span,
-    node_trace: NodeTraceLog,
+    node_trace_supplier: Callable[[], NodeTraceLog],
     m: Meter,
 ) -> HttpRunResponse:
     """Execute the HTTP request with all validations."""
@@ -678,7 +776,7 @@ async def execute_http_request(
         )
     except SparkLinkBaseException as err:
         return await handle_sparklink_error(
-            err, span_context, node_trace, m, params["tool_id"]
+            err, span_context, node_trace_supplier, m, params["tool_id"]
         )
 
     if not operation_id_schema:
@@ -688,7 +786,7 @@ async def execute_http_request(
                 ErrCode.TOOL_NOT_EXIST_ERR,
                 message,
                 span_context,
-                node_trace,
+                node_trace_supplier,
                 m,
                 params["tool_id"],
             )
@@ -698,7 +796,7 @@ async def execute_http_request(
                 ErrCode.OPERATION_ID_NOT_EXIST_ERR,
                 message,
                 span_context,
-                node_trace,
+                node_trace_supplier,
                 m,
                 params["tool_id"],
                 tool_type or "",
@@ -711,7 +809,7 @@ async def execute_http_request(
         run_params_list,
         params,
         span_context,
-        node_trace,
+        node_trace_supplier,
         m,
     )
 
@@ -719,79 +817,64 @@ async def execute_http_request(
 async def http_run(run_params: HttpRunRequest) -> HttpRunResponse:
     """HTTP run with version."""
     run_params_list = run_params.model_dump(exclude_none=True)
-    app_id, uid, caller = extract_request_params(run_params_list)
-    span, node_trace = setup_span_and_trace(run_params_list, app_id, uid, caller)
+    usr_input = dumps_result(run_params_list)
+    app_id, uid, _ = extract_request_params(run_params_list)
+    span = setup_span(run_params_list, app_id, uid)
 
     with span.start(func_name="http_run") as span_context:
-        node_trace.sid = span_context.sid
-        node_trace.chat_id = span_context.sid
-        node_trace.caller = "http_run"
-        m = setup_logging_and_metrics(span_context, run_params_list)
+        node_trace_supplier = node_trace_supplier_for(
+            span_context, "http_run", usr_input
+        )
+        m = setup_logging_and_metrics(span_context, run_params_list, usr_input)
 
         params, error_response = await validate_and_get_params(
-            run_params_list, span_context, node_trace, m
+            run_params_list, span_context, node_trace_supplier, m
         )
         if error_response:
             return error_response
 
         return await execute_http_request(
-            run_params_list, params or {}, span_context, node_trace, m
+            run_params_list, params or {}, span_context, node_trace_supplier, m
         )
 
 
 async def tool_debug(tool_debug_params: ToolDebugRequest) -> ToolDebugResponse:
     """Tool debugging interface."""
-    run_params_list = tool_debug_params.dict()
-    app_id, uid, caller = extract_request_params(run_params_list)
-    tool_id = (
-        run_params_list.get("header", {}).get("tool_id")
-        if run_params_list.get("header", {}).get("tool_id")
-        else ""
-    )
-
-    span = Span(app_id=app_id, uid=uid)
-    sid = run_params_list.get("header", {}).get("sid")
-    if sid:
-        span.sid = sid
+    run_params_list = tool_debug_params.model_dump()
+    usr_input = dumps_result(run_params_list)
+    app_id, uid, _ = extract_request_params(run_params_list)
+    header = run_params_list.get("header") or EMPTY_HEADER
+    tool_id = header.get("tool_id") or ""
+    span = setup_span(run_params_list, app_id, uid)
 
     with span.start(func_name="tool_debug") as span_context:
         m = Meter(app_id=span_context.app_id, func="tool_debug")
+        node_trace_supplier = node_trace_supplier_for(
+            span_context, "tool_debug", usr_input, service_id=tool_id
+        )
+        tool_type = None
         try:
             openapi_schema = json.loads(tool_debug_params.openapi_schema)
-            logger.info(
-                {
-                    "exec api, tool_debug router usr_input": json.dumps(
-                        run_params_list, ensure_ascii=False
-                    )
-                }
-            )
-            span_context.add_info_events(
-                {"usr_input": json.dumps(run_params_list, ensure_ascii=False)}
-            )
+            logger.info({"exec api, tool_debug router usr_input": usr_input})
+            span_context.add_info_events({"usr_input": usr_input})
             span_context.set_attributes(
                 attributes={"server": str(run_params_list.get("server", {}))}
             )
             tool_type = (
-                os.getenv(const.OFFICIAL_TOOL_KEY)
+                const.get_env(const.OFFICIAL_TOOL_KEY)
                 if openapi_schema.get("info").get("x-is-official")
-                else os.getenv(const.THIRD_TOOL_KEY)
-            )
-            node_trace = NodeTraceLog(
-                service_id=tool_id,
-                sid=span_context.sid,
-                app_id=span_context.app_id,
-                uid=span_context.uid,
-                chat_id=span_context.sid,
-                sub="spark-link",
-                caller="tool_debug",
-                log_caller="",
-                question=json.dumps(run_params_list, ensure_ascii=False),
+                else const.get_env(const.THIRD_TOOL_KEY)
             )
 
             validate_err = api_validate(get_tool_debug_schema(), run_params_list)
             if validate_err:
                 return await handle_debug_validation_error(
-                    validate_err, span_context, node_trace, m, tool_id, tool_type or ""
+                    validate_err,
+                    span_context,
+                    node_trace_supplier,
+                    m,
+                    tool_id,
+                    tool_type or "",
                 )
 
             http_inst = HttpRun(
@@ -804,13 +887,15 @@ async def tool_debug(tool_debug_params: ToolDebugRequest) -> ToolDebugResponse:
                 open_api_schema=openapi_schema,
             )
             result = await http_inst.do_call(span_context)
-            result_json = None
-            try:
-                result_json = json.loads(result)
-            except Exception:
-                result_json = result
+            result_json = load_result(result)
 
-            er_msgs = validate_response_schema(result_json, openapi_schema)
+            # Validate against the targeted operation, not the last one listed
+            response_schema = OpenapiSchemaParser(openapi_schema).find_response_schema(
+                tool_debug_params.server or "", tool_debug_params.method or ""
+            )
+            er_msgs = validate_response_schema(
+                result_json, openapi_schema, response_schema
+            )
             if er_msgs:
                 msg = ";".join(er_msgs)
                 detailed_message = (
@@ -821,39 +906,28 @@ async def tool_debug(tool_debug_params: ToolDebugRequest) -> ToolDebugResponse:
                     ErrCode.RESPONSE_SCHEMA_VALIDATE_ERR,
                     detailed_message,
                     span_context,
-                    node_trace,
+                    node_trace_supplier,
                     m,
                     tool_id,
                     tool_type or "",
                 )
 
-            span_context.add_info_events({"before result": result})
-            result = json.dumps(result_json, ensure_ascii=False)
-            span_context.add_info_events({"after result": result})
+            result = canonicalize_result(result, result_json, span_context)
 
             return await handle_debug_success_response(
-                result, span_context, node_trace, m, tool_id, tool_type or ""
+                result, span_context, node_trace_supplier, m, tool_id, tool_type or ""
             )
 
         except SparkLinkBaseException as err:
             return await handle_sparklink_error(
-                err, span_context, node_trace, m, tool_id, tool_type or ""
+                err, span_context, node_trace_supplier, m, tool_id, tool_type or ""
             )
         except Exception as err:
             return await handle_general_exception(
-                err, span_context, node_trace, m, tool_id, tool_type or ""
+                err, span_context, node_trace_supplier, m, tool_id, tool_type or ""
             )
 
 
-def process_array(name: str) -> Tuple[str, int]:
-    """Process array notation in parameter names."""
-    bracket_left_index = name.find("[")
-    bracket_right_index = name.find("]")
-    array_name = name[0:bracket_left_index]
-    array_index = int(name[bracket_left_index + 1 : bracket_right_index])
-    return array_name, array_index
-
-
 def get_response_schema(openapi_schema: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """Get response schema from tool's OpenAPI schema."""
     if openapi_schema is None:
@@ -37,6 +37,8 @@ from plugin.link.consts import const
 from plugin.link.domain.models.manager import get_db_engine
 from plugin.link.exceptions.sparklink_exceptions import SparkLinkBaseException
 from plugin.link.infra.tool_crud.process import ToolCrudOperation
+from plugin.link.service.community.tools.http.schema_cache import invalidate_tool_schema
+from plugin.link.service.community.tools.mcp.url_cache import invalidate_mcp_server_url
 from plugin.link.utils.errors.code import ErrCode
 from plugin.link.utils.json_schemas.read_json_schemas import (
     get_create_tool_schema,
@@ -452,6 +454,9 @@ def delete_version(
             # Delete tools
             crud_inst = ToolCrudOperation(get_db_engine())
             crud_inst.delete_tools(tool_info)
+            for tool in tool_info:
+                invalidate_tool_schema(str(tool["tool_id"]), str(tool["version"]))
+                invalidate_mcp_server_url(str(tool["tool_id"]))
 
             return handle_success_response_mgmt(
                 span_context, node_trace, m, ErrCode.SUCCESSES.msg
@@ -0,0 +1,52 @@
+"""Parsed tool schema cache for community HTTP tools.
+
+A tool version's OpenAPI schema only changes through the management APIs, so
+the execution server keeps the parsed schema per (app_id, tool_id, version)
+for a bounded time and the management APIs invalidate it on change.
+
+The cache is per process: an update only invalidates the worker that handled
+it, and other workers keep serving the old schema until their entry expires
+after ``TOOL_SCHEMA_CACHE_TTL`` seconds.
+"""
+
+import time
+from typing import Any, Dict, Optional, Tuple
+
+TOOL_SCHEMA_CACHE_SIZE = 2048
+TOOL_SCHEMA_CACHE_TTL = 300.0
+
+ToolSchemaKey = Tuple[str, str, str]
+ToolSchemaEntry = Tuple[Dict[str, Any], Optional[str], Dict[str, Any]]
+
+_tool_schema_cache: Dict[ToolSchemaKey, Tuple[float, ToolSchemaEntry]] = {}
+
+
+def get_cached_tool_schema(key: ToolSchemaKey) -> Optional[ToolSchemaEntry]:
+    """Return the cached schema entry for a tool version if still fresh."""
+    cached = _tool_schema_cache.get(key)
+    if cached is None:
+        return None
+    expires_at, entry = cached
+    if expires_at <= time.monotonic():
+        _tool_schema_cache.pop(key, None)
+        return None
+    return entry
+
+
+def set_cached_tool_schema(key: ToolSchemaKey, entry: ToolSchemaEntry) -> None:
+    """Cache a parsed schema entry, evicting the oldest one when full."""
+    if key not in _tool_schema_cache and (
+        len(_tool_schema_cache) >= TOOL_SCHEMA_CACHE_SIZE
+    ):
+        _tool_schema_cache.pop(next(iter(_tool_schema_cache)), None)
+    _tool_schema_cache[key] = (time.monotonic() + TOOL_SCHEMA_CACHE_TTL, entry)
+
+
+def invalidate_tool_schema(tool_id: str, version: Optional[str] = None) -> None:
+    """Drop cached schemas of a tool, for all versions when none is given.
+
+    Only this process's cache is cleared; see the module docstring.
+    """
+    for key in list(_tool_schema_cache):
+        if key[1] == tool_id and (not version or key[2] == version):
+            _tool_schema_cache.pop(key, None)
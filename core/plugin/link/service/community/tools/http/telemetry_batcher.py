@@ -0,0 +1,140 @@
+"""Batched Kafka telemetry for community HTTP tools.
+
+Node traces are best-effort telemetry, so request handlers only enqueue the
+trace and a single background task per event loop serializes and flushes
+queued traces to Kafka in batches, off the event loop.
+"""
+
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Union, cast
+
+from common.otlp.log_trace.node_trace_log import NodeTraceLog
+from common.service import get_kafka_producer_service
+from common.service.kafka.kafka_service import KafkaProducerService
+from loguru import logger
+
+TELEMETRY_QUEUE_SIZE = 10_000
+TELEMETRY_BATCH_SIZE = 1000
+TELEMETRY_LINGER_SECONDS = 0.01
+
+TelemetryPayload = Union[str, NodeTraceLog]
+TelemetryItem = Tuple[str, TelemetryPayload]
+
+
+class TelemetryBatcher:
+    """Queue telemetry payloads and send them to Kafka in batches."""
+
+    def __init__(
+        self,
+        maxsize: int = TELEMETRY_QUEUE_SIZE,
+        batch_size: int = TELEMETRY_BATCH_SIZE,
+        linger: float = TELEMETRY_LINGER_SECONDS,
+    ) -> None:
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.linger = linger
+        self._queue: Optional[asyncio.Queue[TelemetryItem]] = None
+        # Items taken off the queue by a flusher cancelled before sending them
+        self._unsent: List[TelemetryItem] = []
+        self._flusher: Optional[asyncio.Task[None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def submit(self, topic: str, payload: TelemetryPayload) -> None:
+        """Enqueue a payload for the topic, dropping it when the queue is full.
+
+        Node traces are serialized by the flusher, so they must not be
+        modified after submission.
+        """
+        queue = self._ensure_flusher()
+        try:
+            queue.put_nowait((topic, payload))
+        except asyncio.QueueFull:
+            logger.warning(f"Telemetry queue full, dropping trace for {topic}")
+
+    async def close(self) -> None:
+        """Stop the flusher and send everything still queued."""
+        flusher, self._flusher = self._flusher, None
+        if flusher is not None and not flusher.done():
+            flusher.cancel()
+            try:
+                await flusher
+            except asyncio.CancelledError:
+                pass
+        batch = self._take_pending()
+        if batch:
+            await asyncio.to_thread(self._send, batch)
+
+    def drain(self) -> None:
+        """Synchronously send everything still queued, outside a running loop."""
+        batch = self._take_pending()
+        if batch:
+            self._send(batch)
+
+    def _take_pending(self) -> List[TelemetryItem]:
+        pending, self._unsent = self._unsent, []
+        if self._queue is not None:
+            pending += self._take_batch(self._queue, self._queue.qsize())
+        return pending
+
+    def _ensure_flusher(self) -> "asyncio.Queue[TelemetryItem]":
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._queue = asyncio.Queue(maxsize=self.maxsize)
+            self._loop = loop
+            self._flusher = None
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: "asyncio.Queue[TelemetryItem]") -> None:
+        while True:
+            first = await queue.get()
+            try:
+                if self.linger > 0:
+                    await asyncio.sleep(self.linger)
+            except asyncio.CancelledError:
+                # Leave the item for close() rather than sending on the loop
+                self._unsent.append(first)
+                raise
+            batch = [first] + self._take_batch(queue, self.batch_size - 1)
+            await asyncio.to_thread(self._send, batch)
+
+    @staticmethod
+    def _take_batch(
+        queue: "asyncio.Queue[TelemetryItem]", limit: int
+    ) -> List[TelemetryItem]:
+        batch: List[TelemetryItem] = []
+        while len(batch) < limit:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    @staticmethod
+    def _send(batch: List[TelemetryItem]) -> None:
+        by_topic: Dict[str, List[str]] = defaultdict(list)
+        for topic, payload in batch:
+            if isinstance(payload, str):
+                by_topic[topic].append(payload)
+                continue
+            try:
+                by_topic[topic].append(payload.to_json())
+            except Exception as err:
+                logger.error(f"Telemetry trace serialization failed: {err}")
+        if not by_topic:
+            return
+        try:
+            kafka_service = cast(KafkaProducerService, get_kafka_producer_service())
+        except Exception as err:
+            logger.error(f"Telemetry Kafka producer unavailable: {err}")
+            return
+        for topic, payloads in by_topic.items():
+            try:
+                kafka_service.send_batch(topic, payloads)
+            except Exception as err:
+                logger.error(f"Telemetry batch send failed: {err}")
+
+
+telemetry_batcher = TelemetryBatcher()
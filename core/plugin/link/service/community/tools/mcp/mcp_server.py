@@ -5,21 +5,24 @@ It handles tool listing, tool execution, and server management operations with p
 error handling, observability tracing, and security validations.
 """
 
-import os
+import asyncio
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, Union
 
 from common.otlp.log_trace.node_trace_log import NodeTraceLog, Status
 from common.otlp.metrics.meter import Meter
 from common.otlp.trace.span import Span
-from common.service import get_kafka_producer_service
-from fastapi import Body
+from fastapi import Body, Response
 from loguru import logger
 from mcp import ClientSession
 from mcp.client.sse import sse_client
 from opentelemetry.trace import Status as OTelStatus
 from opentelemetry.trace import StatusCode
 from plugin.link.api.schemas.community.tools.mcp.mcp_tools_schema import (
+    MCPBatchCallToolData,
+    MCPBatchCallToolItem,
+    MCPBatchCallToolRequest,
+    MCPBatchCallToolResponse,
     MCPCallToolData,
     MCPCallToolRequest,
     MCPCallToolResponse,
@@ -34,32 +37,68 @@ from plugin.link.api.schemas.community.tools.mcp.mcp_tools_schema import (
 from plugin.link.consts import const
 from plugin.link.domain.models.manager import get_db_engine
 from plugin.link.infra.tool_crud.process import ToolCrudOperation
+from plugin.link.service.community.tools.http.telemetry_batcher import telemetry_batcher
+from plugin.link.service.community.tools.mcp.session_pool import (
+    SessionOpenError,
+    mcp_session_pool,
+)
+from plugin.link.service.community.tools.mcp.url_cache import (
+    get_cached_mcp_server_url,
+    set_cached_mcp_server_url,
+)
 from plugin.link.utils.errors.code import ErrCode
 from plugin.link.utils.security.access_interceptor import is_in_blacklist, is_local_url
 from plugin.link.utils.sid.sid_generator2 import new_sid
+from pydantic import TypeAdapter
+
+# Upper bound on MCP servers contacted concurrently by a single tool_list call
+MCP_TOOL_LIST_MAX_CONCURRENT = 16
+
+MCPResponse = Union[MCPToolListResponse, MCPCallToolResponse, MCPBatchCallToolResponse]
+
+# Response serializers, built once instead of per request
+RESPONSE_ADAPTERS: Dict[type, TypeAdapter[Any]] = {
+    response_cls: TypeAdapter(response_cls)
+    for response_cls in (
+        MCPToolListResponse,
+        MCPCallToolResponse,
+        MCPBatchCallToolResponse,
+    )
+}
+
+# Error reported for each stage at which talking to an MCP server can fail
+MCP_STAGE_ERRORS: Dict[str, ErrCode] = {
+    "connect": ErrCode.MCP_SERVER_CONNECT_ERR,
+    "session": ErrCode.MCP_SERVER_SESSION_ERR,
+    "initialize": ErrCode.MCP_SERVER_INITIAL_ERR,
+    "list_tools": ErrCode.MCP_SERVER_TOOL_LIST_ERR,
+}
+
+
+def _err_item(
+    err: ErrCode, server_id: Optional[str] = None, server_url: Optional[str] = None
+) -> MCPItemInfo:
+    """Build the tool list entry reported for a server that failed."""
+    return MCPItemInfo.model_construct(
+        server_id=server_id,
+        server_url=server_url,
+        server_status=err.code,
+        server_message=err.msg,
+        tools=[],
+    )
 
 
 async def _process_mcp_server_by_id(
     mcp_server_id: str, span_context: Any
 ) -> MCPItemInfo:
     """Process a single MCP server by ID and return its tools."""
-    err, url = get_mcp_server_url(mcp_server_id=mcp_server_id, span=span_context)
+    err, url = await asyncio.to_thread(get_mcp_server_url, mcp_server_id, span_context)
     if err is not ErrCode.SUCCESSES:
-        return MCPItemInfo(
-            server_id=mcp_server_id,
-            server_status=err.code,
-            server_message=err.msg,
-            tools=[],
-        )
+        return _err_item(err, server_id=mcp_server_id)
 
     if is_local_url(url):
         err = ErrCode.MCP_SERVER_LOCAL_URL_ERR
-        return MCPItemInfo(
-            server_id=mcp_server_id,
-            server_status=err.code,
-            server_message=err.msg,
-            tools=[],
-        )
+        return _err_item(err, server_id=mcp_server_id)
 
     return await _connect_and_get_tools(url, server_id=mcp_server_id)
 
@@ -68,21 +107,11 @@ async def _process_mcp_server_by_url(url: str) -> MCPItemInfo:
     """Process a single MCP server by URL and return its tools."""
     if is_local_url(url):
         err = ErrCode.MCP_SERVER_LOCAL_URL_ERR
-        return MCPItemInfo(
-            server_url=str(url),
-            server_status=err.code,
-            server_message=err.msg,
-            tools=[],
-        )
+        return _err_item(err, server_url=str(url))
 
     if is_in_blacklist(url=url):
         err = ErrCode.MCP_SERVER_BLACKLIST_URL_ERR
-        return MCPItemInfo(
-            server_url=str(url),
-            server_status=err.code,
-            server_message=err.msg,
-            tools=[],
-        )
+        return _err_item(err, server_url=str(url))
 
     return await _connect_and_get_tools(url, server_url=url)
 
@@ -91,76 +120,67 @@ async def _connect_and_get_tools(
     url: str, server_id: Optional[str] = None, server_url: Optional[str] = None
 ) -> MCPItemInfo:
     """Connect to MCP server and retrieve tools."""
+    stage = "connect"
     try:
         async with sse_client(url=url) as (read, write):
-            try:
-                async with ClientSession(read, write, logging_callback=None) as session:
-                    try:
-                        await session.initialize()
-                    except Exception:
-                        err = ErrCode.MCP_SERVER_INITIAL_ERR
-                        return MCPItemInfo(
-                            server_id=server_id,
-                            server_url=server_url,
-                            server_status=err.code,
-                            server_message=err.msg,
-                            tools=[],
-                        )
-
-                    try:
-                        tools_result = await session.list_tools()
-                        tools_dict = tools_result.model_dump()["tools"]
-                        tools = []
-                        for tool in tools_dict:
-                            tool_info = MCPInfo(
-                                name=tool.get("name", "No name available"),
-                                description=tool.get(
-                                    "description", "No description available"
-                                ),
-                                inputSchema=tool.get("inputSchema"),
-                            )
-                            tools.append(tool_info)
-
-                        success = ErrCode.SUCCESSES
-                        return MCPItemInfo(
-                            server_id=server_id,
-                            server_url=server_url,
-                            server_status=success.code,
-                            server_message=success.msg,
-                            tools=tools,
-                        )
-                    except Exception:
-                        err = ErrCode.MCP_SERVER_TOOL_LIST_ERR
-                        return MCPItemInfo(
-                            server_id=server_id,
-                            server_url=server_url,
-                            server_status=err.code,
-                            server_message=err.msg,
-                            tools=[],
-                        )
-            except Exception:
-                err = ErrCode.MCP_SERVER_SESSION_ERR
-                return MCPItemInfo(
-                    server_id=server_id,
-                    server_url=server_url,
-                    server_status=err.code,
-                    server_message=err.msg,
-                    tools=[],
-                )
+            stage = "session"
+            async with ClientSession(read, write, logging_callback=None) as session:
+                stage = "initialize"
+                await session.initialize()
+                stage = "list_tools"
+                tools_result = await session.list_tools()
+                # Errors while closing are reported for the layer being closed
+                stage = "session"
+            stage = "connect"
     except Exception:
-        err = ErrCode.MCP_SERVER_CONNECT_ERR
-        return MCPItemInfo(
-            server_id=server_id,
-            server_url=server_url,
-            server_status=err.code,
-            server_message=err.msg,
-            tools=[],
+        return _err_item(
+            MCP_STAGE_ERRORS[stage], server_id=server_id, server_url=server_url
+        )
+
+    # Read the tool models directly; they are already validated by the MCP
+    # client, so skip re-validation
+    tools = [
+        MCPInfo.model_construct(
+            name=getattr(tool, "name", "No name available"),
+            description=getattr(tool, "description", "No description available"),
+            inputSchema=getattr(tool, "inputSchema", None),
         )
+        for tool in tools_result.tools
+    ]
+
+    success = ErrCode.SUCCESSES
+    return MCPItemInfo(
+        server_id=server_id,
+        server_url=server_url,
+        server_status=success.code,
+        server_message=success.msg,
+        tools=tools,
+    )
+
+
+async def _run_bounded(
+    task: Awaitable[MCPItemInfo], semaphore: asyncio.Semaphore
+) -> MCPItemInfo:
+    """Await a per-server task while holding a concurrency slot."""
+    async with semaphore:
+        return await task
 
 
-async def tool_list(list_info: MCPToolListRequest = Body()) -> MCPToolListResponse:
+def _dump_response(result: MCPResponse) -> bytes:
+    """Serialize a response model once, omitting None fields like the routes."""
+    return RESPONSE_ADAPTERS[type(result)].dump_json(result, exclude_none=True)
+
+
+def _json_response(body: bytes) -> Response:
+    """Wrap an already serialized response body."""
+    return Response(content=body, media_type="application/json")
+
+
+async def tool_list(list_info: MCPToolListRequest = Body()) -> Response:
     """
     Get the list of tools.
+
+    The response is serialized once and the same JSON is reused for tracing.
     """
     session_id = new_sid()
     mcp_server_ids = list_info.mcp_server_ids
@@ -175,39 +195,39 @@ async def tool_list(list_info: MCPToolListRequest = Body()) -> MCPToolListRespon
         span.sid = session_id
 
     with span.start(func_name="tool_list") as span_context:
-        logger.info(
-            {"mcp api, tool_list router usr_input": list_info.model_dump_json()}
-        )
-        span_context.add_info_events({"usr_input": list_info.model_dump_json()})
+        usr_input = list_info.model_dump_json()
+        logger.info({"mcp api, tool_list router usr_input": usr_input})
+        span_context.add_info_events({"usr_input": usr_input})
         span_context.set_attributes(attributes={"tool_id": "tool_list"})
-        node_trace = NodeTraceLog(
-            service_id="",
-            sid=span_context.sid,
-            app_id=span_context.app_id,
-            uid=span_context.uid,
-            chat_id=span_context.sid,
-            sub="spark-link",
-            caller="tool_list",
-            log_caller="",
-            question=list_info.model_dump_json(),
-        )
+        node_trace = _new_node_trace(span_context, "tool_list", usr_input)
         m = Meter(app_id=span_context.app_id, func="tool_list")
 
-        items = []
-
-        # Process IDs
-        if mcp_server_ids:
-            for mcp_server_id in mcp_server_ids:
-                item = await _process_mcp_server_by_id(mcp_server_id, span_context)
-                items.append(item)
-
-        # Process URLs
-        if mcp_server_urls:
-            for url in mcp_server_urls:
-                if not url.strip():
-                    continue
-                item = await _process_mcp_server_by_url(url)
-                items.append(item)
+        # Contact every server concurrently so latency is the slowest server,
+        # not the sum of all handshakes
+        targets: List[Tuple[Optional[str], Optional[str]]] = []
+        tasks: List[Awaitable[MCPItemInfo]] = []
+        for mcp_server_id in mcp_server_ids or []:
+            targets.append((mcp_server_id, None))
+            tasks.append(_process_mcp_server_by_id(mcp_server_id, span_context))
+        for url in mcp_server_urls or []:
+            if not url.strip():
+                continue
+            targets.append((None, url))
+            tasks.append(_process_mcp_server_by_url(url))
+
+        semaphore = asyncio.Semaphore(MCP_TOOL_LIST_MAX_CONCURRENT)
+        results = await asyncio.gather(
+            *(_run_bounded(task, semaphore) for task in tasks),
+            return_exceptions=True,
+        )
+        items = [
+            (
+                _err_item(ErrCode.MCP_SERVER_CONNECT_ERR, *target)
+                if isinstance(item, BaseException)
+                else item
+            )
+            for target, item in zip(targets, results)
+        ]
 
         success = ErrCode.SUCCESSES
         result = MCPToolListResponse(
@@ -216,104 +236,103 @@ async def tool_list(list_info: MCPToolListRequest = Body()) -> MCPToolListRespon
             sid=session_id,
             data=MCPToolListData(servers=items),
         )
-        span_context.add_info_events({"tool_list_result": result.model_dump_json()})
-        if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
+        body = _dump_response(result)
+        answer = body.decode()
+        span_context.add_info_events({"tool_list_result": answer})
+        if const.is_otlp_enabled():
             m.in_success_count()
-            node_trace.answer = result.model_dump_json()
+            node_trace.answer = answer
             node_trace.service_id = "tool_list"
             node_trace.log_caller = "mcp_type"
             node_trace.status = Status(
                 code=success.code,
                 message=success.msg,
             )
-            kafka_service = get_kafka_producer_service()
-            node_trace.start_time = int(round(time.time() * 1000))
-            kafka_service.send(os.getenv(const.KAFKA_TOPIC_KEY), node_trace.to_json())
-        return result
+            _send_node_trace(node_trace)
+        return _json_response(body)
+
+
+def _new_node_trace(span_context: Any, caller: str, question: str) -> NodeTraceLog:
+    """Build the request's node trace from trusted span fields.
+
+    Built with model_construct to skip validation; defaults such as srv and
+    trace are still fresh per trace.
+    """
+    return NodeTraceLog.model_construct(
+        service_id="",
+        sid=span_context.sid,
+        app_id=span_context.app_id,
+        uid=span_context.uid,
+        chat_id=span_context.sid,
+        sub="spark-link",
+        caller=caller,
+        log_caller="",
+        question=question,
+    )
+
+
+def _send_node_trace(node_trace: NodeTraceLog) -> None:
+    """Stamp the node trace and queue it for the batched Kafka sender.
+
+    Serialization and the broker round-trip happen on the telemetry flusher,
+    off the request.
+    """
+    node_trace.start_time = time.time_ns() // 1_000_000
+    telemetry_batcher.submit(const.get_env(const.KAFKA_TOPIC_KEY) or "", node_trace)
 
 
 def _create_error_response(err: ErrCode, session_id: str) -> MCPCallToolResponse:
     """Create a standardized error response for MCP call tool failures."""
-    return MCPCallToolResponse(
+    return MCPCallToolResponse.model_construct(
         code=err.code,
         message=err.msg,
         sid=session_id,
-        data=MCPCallToolData(isError=None, content=None),
+        data=MCPCallToolData.model_construct(isError=None, content=None),
     )
 
 
 def _log_error_to_kafka(
-    err: ErrCode, node_trace: NodeTraceLog, mcp_server_id: str, m: Meter
+    err: ErrCode,
+    node_trace: NodeTraceLog,
+    mcp_server_id: str,
+    m: Meter,
+    count: bool = True,
 ) -> None:
-    """Log error information to Kafka if OTLP is enabled."""
-    if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
-        m.in_error_count(err.code)
+    """Log error information to Kafka if OTLP is enabled.
+
+    ``count`` is False when the error metric was already recorded.
+    """
+    if const.is_otlp_enabled():
+        if count:
+            m.in_error_count(err.code)
         node_trace.answer = err.msg
         node_trace.service_id = mcp_server_id
         node_trace.status = Status(
             code=err.code,
             message=err.msg,
         )
-        kafka_service = get_kafka_producer_service()
-        node_trace.start_time = int(round(time.time() * 1000))
-        kafka_service.send(os.getenv(const.KAFKA_TOPIC_KEY), node_trace.to_json())
-
-
-async def _initialize_session(
-    session: Any,
-    session_id: str,
-    span_context: Any,
-    node_trace: NodeTraceLog,
-    mcp_server_id: str,
-    m: Meter,
-) -> Optional[MCPCallToolResponse]:
-    """Initialize MCP session with error handling."""
-    try:
-        await session.initialize()
-    except Exception:
-        err = ErrCode.MCP_SERVER_INITIAL_ERR
-        span_context.add_error_event(err.msg)
-        span_context.set_status(OTelStatus(StatusCode.ERROR))
-        _log_error_to_kafka(err, node_trace, mcp_server_id, m)
-        return _create_error_response(err, session_id)
-    return None
-
-
-async def _execute_tool_call(
-    session: Any,
-    tool_name: str,
-    tool_args: Dict[str, Any],
-    session_id: str,
-    span_context: Any,
-    node_trace: NodeTraceLog,
-    mcp_server_id: str,
-    m: Meter,
-) -> Union[
-    Tuple[bool, List[Union[MCPTextResponse, MCPImageResponse]]],
-    Tuple[MCPCallToolResponse, None],
-]:
-    """Execute the actual tool call and process response."""
-    try:
-        call_result = await session.call_tool(tool_name, arguments=tool_args)
-        call_dict = call_result.model_dump()
-        is_error = call_dict["isError"]
-        content = []
-
-        for data in call_dict["content"]:
-            if data["type"] == "text":
-                text = MCPTextResponse(text=data["text"])
-                content.append(text)
-            elif data["type"] == "image":
-                image = MCPImageResponse(data=data["data"], mineType=data["mineType"])
-                content.append(image)
-
-        return is_error, content
-    except Exception:
-        err = ErrCode.MCP_SERVER_CALL_TOOL_ERR
-        span_context.add_error_event(err.msg)
-        span_context.set_status(OTelStatus(StatusCode.ERROR))
-        _log_error_to_kafka(err, node_trace, mcp_server_id, m)
-        return _create_error_response(err, session_id), None
+        _send_node_trace(node_trace)
+
+
+def _call_result_content(
+    call_result: Any,
+) -> Tuple[bool, List[Union[MCPTextResponse, MCPImageResponse]]]:
+    """Convert an MCP call_tool result into the error flag and content list."""
+    # Read the client's validated content models directly instead of dumping
+    # the whole result to dicts and re-validating each item
+    content: List[Union[MCPTextResponse, MCPImageResponse]] = [
+        (
+            MCPTextResponse.model_construct(text=item.text)
+            if item.type == "text"
+            else MCPImageResponse.model_construct(
+                data=item.data, mineType=item.mimeType
+            )
+        )
+        for item in call_result.content
+        if item.type in ("text", "image")
+    ]
+    is_error = call_result.isError
+    return is_error, content
 
 
 async def _call_mcp_tool(
@@ -326,91 +345,74 @@ async def _call_mcp_tool(
     mcp_server_id: str,
     m: Meter,
 ) -> MCPCallToolResponse:
-    """Execute the actual MCP tool call with proper error handling."""
-    try:
-        async with sse_client(url=url) as (read, write):
-            try:
-                async with ClientSession(read, write, logging_callback=None) as session:
-                    # Initialize session
-                    init_result = await _initialize_session(
-                        session, session_id, span_context, node_trace, mcp_server_id, m
-                    )
-                    if init_result:
-                        return init_result
-
-                    # Execute tool call
-                    call_result = await _execute_tool_call(
-                        session,
-                        tool_name,
-                        tool_args,
-                        session_id,
-                        span_context,
-                        node_trace,
-                        mcp_server_id,
-                        m,
-                    )
+    """Execute the MCP tool call on a pooled session with proper error handling.
 
-                    if isinstance(call_result[0], MCPCallToolResponse):
-                        return call_result[0]
-
-                    is_error, content = call_result
-                    success = ErrCode.SUCCESSES
-                    return MCPCallToolResponse(
-                        code=success.code,
-                        message=success.msg,
-                        sid=session_id,
-                        data=MCPCallToolData(isError=is_error, content=content),
-                    )
-            except Exception:
-                err = ErrCode.MCP_SERVER_SESSION_ERR
-                span_context.add_error_event(err.msg)
-                span_context.set_status(OTelStatus(StatusCode.ERROR))
-                _log_error_to_kafka(err, node_trace, mcp_server_id, m)
-                return _create_error_response(err, session_id)
+    The call runs inside the pool lease so a failure retires the session.
+    """
+    try:
+        async with mcp_session_pool.session(url) as session:
+            call_result = await session.call_tool(tool_name, arguments=tool_args)
+        is_error, content = _call_result_content(call_result)
+    except SessionOpenError as open_err:
+        err = MCP_STAGE_ERRORS[open_err.stage]
     except Exception:
-        err = ErrCode.MCP_SERVER_CONNECT_ERR
-        span_context.add_error_event(err.msg)
-        span_context.set_status(OTelStatus(StatusCode.ERROR))
-        _log_error_to_kafka(err, node_trace, mcp_server_id, m)
-        return _create_error_response(err, session_id)
+        err = ErrCode.MCP_SERVER_CALL_TOOL_ERR
+    else:
+        success = ErrCode.SUCCESSES
+        return MCPCallToolResponse(
+            code=success.code,
+            message=success.msg,
+            sid=session_id,
+            data=MCPCallToolData(isError=is_error, content=content),
+        )
+
+    span_context.add_error_event(err.msg)
+    span_context.set_status(OTelStatus(StatusCode.ERROR))
+    _log_error_to_kafka(err, node_trace, mcp_server_id, m)
+    return _create_error_response(err, session_id)
 
 
-def _validate_and_get_url(
+async def _validate_and_get_url(
     call_info: MCPCallToolRequest, session_id: str, span_context: Any, m: Meter
 ) -> Tuple[ErrCode, str]:
-    """Validate URL and get it from database if needed."""
+    """Validate URL and get it from database if needed.
+
+    The database lookup runs in a worker thread to keep the event loop free.
+    """
     url = call_info.mcp_server_url
 
     # Check blacklist first
     if url and is_in_blacklist(url=url):
         err = ErrCode.MCP_SERVER_BLACKLIST_URL_ERR
-        if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
+        if const.is_otlp_enabled():
             m.in_error_count(err.code)
         return err, ""
 
     # Get URL from database if not provided
     if not url:
-        err, url = get_mcp_server_url(
-            mcp_server_id=call_info.mcp_server_id, span=span_context
+        err, url = await asyncio.to_thread(
+            get_mcp_server_url, call_info.mcp_server_id, span_context
         )
         if err is not ErrCode.SUCCESSES:
-            if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
+            if const.is_otlp_enabled():
                 m.in_error_count(err.code)
             return err, ""
 
     # Check local URL
     if is_local_url(url):
         err = ErrCode.MCP_SERVER_LOCAL_URL_ERR
-        if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
+        if const.is_otlp_enabled():
             m.in_error_count(err.code)
         return err, ""
 
     return ErrCode.SUCCESSES, url
 
 
-async def call_tool(call_info: MCPCallToolRequest = Body()) -> MCPCallToolResponse:
+async def call_tool(call_info: MCPCallToolRequest = Body()) -> Response:
     """
     Call a tool.
+
+    The response is serialized once and the same JSON is reused for tracing.
     """
     session_id = new_sid()
     mcp_server_id = call_info.mcp_server_id
@@ -426,30 +428,21 @@ async def call_tool(call_info: MCPCallToolRequest = Body()) -> MCPCallToolRespon
         span.sid = session_id
 
     with span.start(func_name="call_tool") as span_context:
-        logger.info(
-            {"mcp api, call_tool router usr_input": call_info.model_dump_json()}
-        )
-        span_context.add_info_events({"usr_input": call_info.model_dump_json()})
+        usr_input = call_info.model_dump_json()
+        logger.info({"mcp api, call_tool router usr_input": usr_input})
+        span_context.add_info_events({"usr_input": usr_input})
         span_context.set_attributes(attributes={"tool_id": str(mcp_server_id)})
-        node_trace = NodeTraceLog(
-            service_id="",
-            sid=span_context.sid,
-            app_id=span_context.app_id,
-            uid=span_context.uid,
-            chat_id=span_context.sid,
-            sub="spark-link",
-            caller="call_tool",
-            log_caller="",
-            question=call_info.model_dump_json(),
-        )
+        node_trace = _new_node_trace(span_context, "call_tool", usr_input)
         m = Meter(app_id=span_context.app_id, func="call_tool")
 
         # Validate URL and get it from database if needed
-        err, url = _validate_and_get_url(call_info, session_id, span_context, m)
+        err, url = await _validate_and_get_url(call_info, session_id, span_context, m)
         if err is not ErrCode.SUCCESSES:
             if not call_info.mcp_server_url:
                 node_trace.answer = err.msg
-            return _create_error_response(err, session_id)
+            return _json_response(
+                _dump_response(_create_error_response(err, session_id))
+            )
 
         # Call the MCP tool
         result = await _call_mcp_tool(
@@ -462,25 +455,179 @@ async def call_tool(call_info: MCPCallToolRequest = Body()) -> MCPCallToolRespon
             mcp_server_id,
             m,
         )
-        span_context.add_info_events({"call_tool_result": result.model_dump_json()})
+        body = _dump_response(result)
+        answer = body.decode()
+        span_context.add_info_events({"call_tool_result": answer})
         # Log success if the call succeeded
         if result.code == ErrCode.SUCCESSES.code:
-            if os.getenv(const.OTLP_ENABLE_KEY, "0").lower() == "1":
+            if const.is_otlp_enabled():
                 m.in_success_count()
-                node_trace.answer = result.model_dump_json()
+                node_trace.answer = answer
                 node_trace.service_id = mcp_server_id
                 node_trace.log_caller = "mcp_type"
                 node_trace.status = Status(
                     code=ErrCode.SUCCESSES.code,
                     message=ErrCode.SUCCESSES.msg,
                 )
-                kafka_service = get_kafka_producer_service()
-                node_trace.start_time = int(round(time.time() * 1000))
-                kafka_service.send(
-                    os.getenv(const.KAFKA_TOPIC_KEY), node_trace.to_json()
+                _send_node_trace(node_trace)
+
+        return _json_response(body)
+
+
+def _batch_error_item(err: ErrCode) -> MCPBatchCallToolItem:
+    """Build the result slot for a batched call that did not run successfully."""
+    return MCPBatchCallToolItem.model_construct(
+        code=err.code,
+        message=err.msg,
+        data=MCPCallToolData.model_construct(isError=None, content=None),
+    )
+
+
+async def _batch_call_one(
+    url: str,
+    call_info: MCPCallToolRequest,
+    semaphore: asyncio.Semaphore,
+    stop: Optional[asyncio.Event],
+    failed_urls: Dict[str, ErrCode],
+) -> Union[MCPBatchCallToolItem, ErrCode]:
+    """Run one batched call on the URL's pooled session.
+
+    The semaphore covers opening the session as well as the call, so
+    ``max_concurrent`` also bounds how many servers are connected at once.
+    A server that failed to open is not retried within the batch.
+    """
+    async with semaphore:
+        if stop is not None and stop.is_set():
+            return ErrCode.MCP_SERVER_CALL_TOOL_SKIPPED_ERR
+        err = failed_urls.get(url)
+        if err is None:
+            try:
+                async with mcp_session_pool.session(url) as session:
+                    call_result = await session.call_tool(
+                        call_info.tool_name, arguments=call_info.tool_args
+                    )
+                is_error, content = _call_result_content(call_result)
+            except SessionOpenError as open_err:
+                err = failed_urls[url] = MCP_STAGE_ERRORS[open_err.stage]
+            except Exception:
+                err = ErrCode.MCP_SERVER_CALL_TOOL_ERR
+        if err is not None:
+            if stop is not None:
+                stop.set()
+            return err
+
+    success = ErrCode.SUCCESSES
+    return MCPBatchCallToolItem(
+        code=success.code,
+        message=success.msg,
+        data=MCPCallToolData(isError=is_error, content=content),
+    )
+
+
+def _report_batch_call_error(
+    err: ErrCode,
+    call_info: MCPCallToolRequest,
+    span_context: Any,
+    usr_input: str,
+    m: Meter,
+    count: bool = True,
+) -> None:
+    """Record a failed batched call on the span and as its own node trace."""
+    span_context.add_error_event(err.msg)
+    span_context.set_status(OTelStatus(StatusCode.ERROR))
+    if const.is_otlp_enabled():
+        node_trace = _new_node_trace(span_context, "batch_call_tool", usr_input)
+        node_trace.log_caller = "mcp_type"
+        _log_error_to_kafka(err, node_trace, call_info.mcp_server_id or "", m, count)
+
+
+async def batch_call_tool(batch_info: MCPBatchCallToolRequest = Body()) -> Response:
+    """
+    Call several tools, sharing one session per MCP server.
+
+    Each call gets its own result slot, so individual failures are reported
+    per call while the batch itself succeeds.
+    """
+    session_id = new_sid()
+
+    span = Span(
+        app_id="appid_mcp",
+        uid="mcp_uid",
+    )
+
+    if session_id:
+        span.sid = session_id
+
+    with span.start(func_name="batch_call_tool") as span_context:
+        usr_input = batch_info.model_dump_json()
+        logger.info({"mcp api, batch_call_tool router usr_input": usr_input})
+        span_context.add_info_events({"usr_input": usr_input})
+        span_context.set_attributes(attributes={"tool_id": "batch_call_tool"})
+        node_trace = _new_node_trace(span_context, "batch_call_tool", usr_input)
+        m = Meter(app_id=span_context.app_id, func="batch_call_tool")
+
+        # Resolve every URL up front; calls to one server share its pooled session
+        results: List[Optional[MCPBatchCallToolItem]] = [None] * len(batch_info.calls)
+        resolved = await asyncio.gather(
+            *(
+                _validate_and_get_url(call_info, session_id, span_context, m)
+                for call_info in batch_info.calls
+            )
+        )
+        pending: List[Tuple[int, MCPCallToolRequest, str]] = []
+        for index, (call_info, (err, url)) in enumerate(
+            zip(batch_info.calls, resolved)
+        ):
+            if err is not ErrCode.SUCCESSES:
+                # The error metric is already counted by _validate_and_get_url
+                _report_batch_call_error(
+                    err, call_info, span_context, usr_input, m, count=False
                 )
+                results[index] = _batch_error_item(err)
+            else:
+                pending.append((index, call_info, url))
+
+        semaphore = asyncio.Semaphore(batch_info.max_concurrent)
+        stop = asyncio.Event() if batch_info.stop_on_error else None
+        failed_urls: Dict[str, ErrCode] = {}
+        outcomes = await asyncio.gather(
+            *(
+                _batch_call_one(url, call_info, semaphore, stop, failed_urls)
+                for _, call_info, url in pending
+            )
+        )
+        for (index, call_info, _), outcome in zip(pending, outcomes):
+            if isinstance(outcome, ErrCode):
+                if outcome is not ErrCode.MCP_SERVER_CALL_TOOL_SKIPPED_ERR:
+                    _report_batch_call_error(
+                        outcome, call_info, span_context, usr_input, m
+                    )
+                outcome = _batch_error_item(outcome)
+            results[index] = outcome
 
-        return result
+        success = ErrCode.SUCCESSES
+        result = MCPBatchCallToolResponse(
+            code=success.code,
+            message=success.msg,
+            sid=session_id,
+            data=MCPBatchCallToolData(
+                results=[item for item in results if item is not None]
+            ),
+        )
+        body = _dump_response(result)
+        answer = body.decode()
+        span_context.add_info_events({"batch_call_tool_result": answer})
+        if const.is_otlp_enabled():
+            m.in_success_count()
+            node_trace.answer = answer
+            node_trace.service_id = "batch_call_tool"
+            node_trace.log_caller = "mcp_type"
+            node_trace.status = Status(
+                code=success.code,
+                message=success.msg,
+            )
+            _send_node_trace(node_trace)
+        return _json_response(body)
 
 
 def get_mcp_server_url(mcp_server_id: str, span: Span) -> Tuple[ErrCode, str]:
@@ -496,6 +643,10 @@ def get_mcp_server_url(mcp_server_id: str, span: Span) -> Tuple[ErrCode, str]:
     if not mcp_server_id:
         return (ErrCode.MCP_SERVER_ID_EMPTY_ERR, "")
 
+    cached_url = get_cached_mcp_server_url(mcp_server_id)
+    if cached_url:
+        return (ErrCode.SUCCESSES, cached_url)
+
     tool_id_info = [{"app_id": "1232223", "tool_id": mcp_server_id}]
     try:
         crud_inst = ToolCrudOperation(get_db_engine())
@@ -506,17 +657,16 @@ def get_mcp_server_url(mcp_server_id: str, span: Span) -> Tuple[ErrCode, str]:
     if not query_results:
         return (ErrCode.MCP_SERVER_NOT_FOUND_ERR, "")
 
-    mcp_server = ""
-    for query_result in query_results:
-        result_dict = query_result.dict()
-        if result_dict.get("tool_id", "") != mcp_server_id:
-            continue
-
-        # Database extension mcp_server_url stores MCP URL data
-        mcp_server = result_dict.get("mcp_server_url", "")
-        break
+    # get_tools returns at most one row per requested tool id
+    query_result = query_results[0]
+    if query_result.tool_id != mcp_server_id:
+        return (ErrCode.MCP_SERVER_NOT_FOUND_ERR, "")
 
+    # Database extension mcp_server_url stores MCP URL data
+    mcp_server = query_result.mcp_server_url or ""
     if not mcp_server:
         return (ErrCode.MCP_SERVER_URL_EMPTY_ERR, mcp_server)
 
+    # Only successful lookups are cached so failures are retried
+    set_cached_mcp_server_url(mcp_server_id, mcp_server)
     return (ErrCode.SUCCESSES, mcp_server)
@@ -0,0 +1,262 @@
+"""Pooled MCP client sessions.
+
+Opening an MCP session costs an SSE handshake plus ``initialize``, so call_tool
+keeps one warm ``ClientSession`` per server URL and reuses it across requests.
+Each session is owned by a background task (the SSE client must be entered and
+exited in the same task) and is closed after it has been idle for a while.
+
+A session is retired, and replaced on the next request, once its SSE stream
+ends, a call on it fails or times out, or it reaches its request or age limit.
+Error replies from the server leave the session in the pool. The limits
+bound the per-request bookkeeping a ``ClientSession`` keeps until it exits.
+The pool holds at most ``max_size`` URLs and retires the least recently used
+one to make room.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Any, AsyncIterator, Dict, Literal, Optional
+
+import httpx
+from loguru import logger
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.shared.exceptions import McpError
+from plugin.link.consts import const
+
+MCP_SESSION_IDLE_SECONDS = 60.0
+MCP_SESSION_MAX_AGE_SECONDS = 600.0
+MCP_SESSION_MAX_REQUESTS = 1000
+MCP_SESSION_POOL_SIZE = 256
+# Default upper bound for any single request on a pooled session, initialize
+# included; matches the SSE read timeout of sse_client
+MCP_SESSION_READ_TIMEOUT_SECONDS = 300.0
+
+OpenStage = Literal["connect", "session", "initialize"]
+
+
+class SessionOpenError(Exception):
+    """Raised when a pooled session cannot be opened.
+
+    ``stage`` tells callers whether the SSE connection, the client session or
+    the MCP initialize handshake failed.
+    """
+
+    def __init__(self, stage: OpenStage) -> None:
+        super().__init__(f"MCP session {stage} failed")
+        self.stage = stage
+
+
+def _read_timeout() -> timedelta:
+    """Return the per-request timeout, from MCP_SESSION_READ_TIMEOUT if valid."""
+    value = const.get_env(const.MCP_SESSION_READ_TIMEOUT_KEY)
+    seconds = MCP_SESSION_READ_TIMEOUT_SECONDS
+    if value:
+        try:
+            seconds = float(value)
+        except ValueError:
+            logger.warning(f"MCP_SESSION_READ_TIMEOUT={value!r} is not a number")
+        if seconds <= 0:
+            logger.warning(f"MCP_SESSION_READ_TIMEOUT={value!r} must be positive")
+            seconds = MCP_SESSION_READ_TIMEOUT_SECONDS
+    return timedelta(seconds=seconds)
+
+
+class _PooledSession:
+    """A warm session for one URL, kept open by its owner task."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.in_use = 0
+        self.requests = 0
+        self.retired = False
+        self.opened_at = self.last_used = time.monotonic()
+        self.ready: "asyncio.Future[ClientSession]" = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._read: Any = None
+        self._closing = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    @property
+    def connected(self) -> bool:
+        """Whether the owner task still holds an open SSE stream."""
+        if self._task.done() or self._closing.is_set():
+            return False
+        # sse_client closes its end of the read stream once the SSE connection
+        # drops or times out, while the owner task keeps waiting
+        return self._read is None or self._read.statistics().open_send_streams > 0
+
+    def reusable(self, max_age: float, max_requests: int) -> bool:
+        """Whether new requests may still be served by this session."""
+        return (
+            not self.retired
+            and self.connected
+            and self.requests < max_requests
+            and time.monotonic() - self.opened_at < max_age
+        )
+
+    def retire(self) -> None:
+        """Stop handing out this session and close it once it is unused.
+
+        A session whose stream has ended is closed right away so requests
+        still waiting on it fail instead of waiting for their timeout.
+        """
+        self.retired = True
+        if self.in_use == 0 or not self.connected:
+            self._closing.set()
+
+    async def close(self) -> None:
+        """Close the session and wait for its owner task to finish."""
+        self._closing.set()
+        try:
+            await self._task
+        except Exception as err:
+            logger.warning(f"Closing MCP session for {self.url} failed: {err}")
+
+    async def _run(self) -> None:
+        stage: OpenStage = "connect"
+        try:
+            async with sse_client(url=self.url) as (read, write):
+                stage = "session"
+                self._read = read
+                async with ClientSession(
+                    read,
+                    write,
+                    read_timeout_seconds=_read_timeout(),
+                    logging_callback=None,
+                ) as session:
+                    stage = "initialize"
+                    await session.initialize()
+                    self.ready.set_result(session)
+                    await self._closing.wait()
+        except Exception as err:
+            if not self.ready.done():
+                self.ready.set_exception(SessionOpenError(stage))
+            else:
+                logger.warning(f"MCP session for {self.url} closed: {err}")
+        finally:
+            if not self.ready.done():
+                self.ready.set_exception(SessionOpenError(stage))
+
+
+class MCPSessionPool:
+    """Keep one warm MCP client session per server URL."""
+
+    def __init__(
+        self,
+        idle_seconds: float = MCP_SESSION_IDLE_SECONDS,
+        max_size: int = MCP_SESSION_POOL_SIZE,
+        max_age: float = MCP_SESSION_MAX_AGE_SECONDS,
+        max_requests: int = MCP_SESSION_MAX_REQUESTS,
+    ) -> None:
+        self.idle_seconds = idle_seconds
+        self.max_size = max_size
+        self.max_age = max_age
+        self.max_requests = max_requests
+        # Ordered from least to most recently used
+        self._sessions: Dict[str, _PooledSession] = {}
+        self._reaper: Optional[asyncio.Task[None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @asynccontextmanager
+    async def session(self, url: str) -> AsyncIterator[ClientSession]:
+        """Yield an initialized session for the URL, opening one if needed.
+
+        An exception raised while the session is in use retires it, so the
+        next request for the URL opens a fresh connection. Error replies from
+        the server are the exception: only a timed-out request retires it.
+
+        Raises:
+            SessionOpenError: If no session could be opened for the URL
+        """
+        entry = self._get_or_open(url)
+        entry.in_use += 1
+        entry.requests += 1
+        try:
+            try:
+                session = await entry.ready
+            except SessionOpenError:
+                self._discard(url, entry)
+                raise
+            try:
+                yield session
+            except McpError as err:
+                if err.error.code == httpx.codes.REQUEST_TIMEOUT:
+                    self._discard(url, entry)
+                raise
+            except Exception:
+                self._discard(url, entry)
+                raise
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+            if entry.retired:
+                entry.retire()
+
+    async def close(self) -> None:
+        """Close every pooled session and stop the idle reaper."""
+        reaper, self._reaper = self._reaper, None
+        if reaper is not None and not reaper.done():
+            reaper.cancel()
+            try:
+                await reaper
+            except asyncio.CancelledError:
+                pass
+        sessions, self._sessions = list(self._sessions.values()), {}
+        for entry in sessions:
+            await entry.close()
+
+    def _get_or_open(self, url: str) -> _PooledSession:
+        # Lookup and insert happen without awaiting, so concurrent requests for
+        # the same URL share one entry
+        self._ensure_reaper()
+        entry = self._sessions.pop(url, None)
+        if entry is not None and not entry.reusable(self.max_age, self.max_requests):
+            entry.retire()
+            entry = None
+        if entry is None:
+            while len(self._sessions) >= self.max_size:
+                self._sessions.pop(next(iter(self._sessions))).retire()
+            entry = _PooledSession(url)
+        self._sessions[url] = entry
+        return entry
+
+    def _discard(self, url: str, entry: _PooledSession) -> None:
+        if self._sessions.get(url) is entry:
+            del self._sessions[url]
+        entry.retire()
+
+    def _ensure_reaper(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Sessions belong to the loop that opened them
+            self._sessions = {}
+            self._loop = loop
+            self._reaper = None
+        if self._reaper is None or self._reaper.done():
+            self._reaper = loop.create_task(self._reap())
+
+    async def _reap(self) -> None:
+        while True:
+            await asyncio.sleep(self.idle_seconds / 2)
+            await self._reap_once()
+
+    async def _reap_once(self) -> None:
+        # Update the pool before awaiting any close, so entries opened while
+        # sessions are closing are never dropped from it
+        deadline = time.monotonic() - self.idle_seconds
+        expired = []
+        for url, entry in list(self._sessions.items()):
+            if entry.in_use == 0 and entry.last_used < deadline:
+                del self._sessions[url]
+                expired.append(entry)
+            elif not entry.connected and entry.ready.done():
+                self._discard(url, entry)
+        for entry in expired:
+            await entry.close()
+
+
+mcp_session_pool = MCPSessionPool()
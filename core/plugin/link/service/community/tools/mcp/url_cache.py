@@ -0,0 +1,49 @@
+"""MCP server URL cache.
+
+An MCP server's URL only changes when the server is registered again, so the
+MCP server keeps resolved URLs per server id for a bounded time and the
+registration API invalidates them on change. Lookups run in worker threads,
+hence the lock.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+MCP_SERVER_URL_CACHE_SIZE = 4096
+MCP_SERVER_URL_CACHE_TTL = 60.0
+
+_mcp_server_url_cache: Dict[str, Tuple[float, str]] = {}
+_lock = threading.Lock()
+
+
+def get_cached_mcp_server_url(mcp_server_id: str) -> Optional[str]:
+    """Return the cached URL of an MCP server if still fresh."""
+    cached = _mcp_server_url_cache.get(mcp_server_id)
+    if cached is None:
+        return None
+    expires_at, url = cached
+    if expires_at <= time.monotonic():
+        with _lock:
+            _mcp_server_url_cache.pop(mcp_server_id, None)
+        return None
+    return url
+
+
+def set_cached_mcp_server_url(mcp_server_id: str, url: str) -> None:
+    """Cache a resolved URL, evicting the oldest one when full."""
+    with _lock:
+        if mcp_server_id not in _mcp_server_url_cache and (
+            len(_mcp_server_url_cache) >= MCP_SERVER_URL_CACHE_SIZE
+        ):
+            _mcp_server_url_cache.pop(next(iter(_mcp_server_url_cache)), None)
+        _mcp_server_url_cache[mcp_server_id] = (
+            time.monotonic() + MCP_SERVER_URL_CACHE_TTL,
+            url,
+        )
+
+
+def invalidate_mcp_server_url(mcp_server_id: str) -> None:
+    """Drop the cached URL of an MCP server."""
+    with _lock:
+        _mcp_server_url_cache.pop(mcp_server_id, None)
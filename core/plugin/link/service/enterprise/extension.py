@@ -25,6 +25,7 @@ from plugin.link.api.schemas.enterprise.extension_schema import (
 from plugin.link.consts import const
 from plugin.link.domain.models.manager import get_db_engine
 from plugin.link.infra.tool_crud.process import ToolCrudOperation
+from plugin.link.service.community.tools.mcp.url_cache import invalidate_mcp_server_url
 from plugin.link.utils.errors.code import ErrCode
 from plugin.link.utils.json_schemas.read_json_schemas import get_mcp_register_schema
 from plugin.link.utils.json_schemas.schema_validate import api_validate
@@ -124,6 +125,7 @@ def register_mcp(
             )
             crud_inst = ToolCrudOperation(get_db_engine())
             crud_inst.add_mcp(tool_info)
+            invalidate_mcp_server_url(tool_id)
             resp_data = {"name": mcp_name, "id": tool_id}
             span_context.add_info_events(
                 {"register_mcp_result": json.dumps(resp_data, ensure_ascii=False)}
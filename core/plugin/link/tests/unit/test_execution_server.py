@@ -0,0 +1,565 @@
+"""
+Unit tests for the HTTP execution server
+Tests response schema validation helpers
+"""
+
+import asyncio
+import json
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+# execution_server binds get_http_run_schema at import time, so it is imported
+# inside the tests to keep the session-wide schema patches in conftest effective
+
+
+def _openapi_with_response(schema: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "paths": {
+            "/test": {
+                "get": {
+                    "operationId": "test_op",
+                    "responses": {
+                        "200": {"content": {"application/json": {"schema": schema}}}
+                    },
+                }
+            }
+        }
+    }
+
+
+@pytest.mark.unit
+class TestResponseSchemaValidation:
+    """Test class for response schema validation"""
+
+    def test_get_response_validator_is_cached(self) -> None:
+        """Test equal schemas share one compiled validator"""
+        from plugin.link.service.community.tools.http.execution_server import (
+            get_response_validator,
+        )
+
+        schema_a = {"type": "object", "properties": {"a": {"type": "string"}}}
+        schema_b = {"properties": {"a": {"type": "string"}}, "type": "object"}
+
+        assert get_response_validator(schema_a) is get_response_validator(schema_b)
+
+    def test_validate_response_schema_reports_type_errors(self) -> None:
+        """Test mismatched types are reported with their path"""
+        from plugin.link.service.community.tools.http.execution_server import (
+            validate_response_schema,
+        )
+
+        open_api_schema = _openapi_with_response(
+            {"type": "object", "properties": {"count": {"type": "integer"}}}
+        )
+
+        er_msgs = validate_response_schema({"count": "x"}, open_api_schema)
+
+        assert len(er_msgs) == 1
+        assert "$.count" in er_msgs[0]
+
+    def test_validate_response_schema_prefers_operation_schema(self) -> None:
+        """Test the operation's parsed response schema is used when given"""
+        from plugin.link.service.community.tools.http.execution_server import (
+            validate_response_schema,
+        )
+
+        open_api_schema = _openapi_with_response(
+            {"type": "object", "properties": {"count": {"type": "integer"}}}
+        )
+        operation_schema = {
+            "type": "object",
+            "properties": {"count": {"type": "string"}},
+        }
+
+        er_msgs = validate_response_schema(
+            {"count": "x"}, open_api_schema, operation_schema
+        )
+
+        assert er_msgs == []
+
+    def test_debug_response_schema_matches_targeted_operation(self) -> None:
+        """Test the debug lookup picks the operation by server URL and method"""
+        from plugin.link.utils.open_api_schema.schema_parser import OpenapiSchemaParser
+
+        first = {"type": "object", "properties": {"a": {"type": "string"}}}
+        second = {"type": "object", "properties": {"b": {"type": "integer"}}}
+        open_api_schema = {
+            "servers": [{"url": "https://api.example.com"}],
+            "paths": {
+                "/first": _openapi_with_response(first)["paths"]["/test"],
+                "/second": _openapi_with_response(second)["paths"]["/test"],
+            },
+        }
+        parser = OpenapiSchemaParser(open_api_schema)
+
+        assert parser.find_response_schema("https://api.example.com/first", "GET") == (
+            first
+        )
+        assert parser.find_response_schema("https://api.example.com/second", "get") == (
+            second
+        )
+        assert parser.find_response_schema("https://other.example.com", "get") is None
+
+    def test_valid_response_skips_jsonschema_validator(self) -> None:
+        """Test responses passing the compiled check never reach jsonschema"""
+        from plugin.link.service.community.tools.http import execution_server
+
+        open_api_schema = _openapi_with_response(
+            {"type": "object", "properties": {"count": {"type": "integer"}}}
+        )
+
+        with patch.object(
+            execution_server, "_build_response_validator"
+        ) as mock_validator:
+            er_msgs = execution_server.validate_response_schema(
+                {"count": 1}, open_api_schema
+            )
+
+        assert er_msgs == []
+        mock_validator.assert_not_called()
+
+    def test_uncompilable_pattern_falls_back_to_jsonschema(self) -> None:
+        """Test a pattern fastjsonschema cannot compile uses Draft7 instead"""
+        from plugin.link.service.community.tools.http import execution_server
+
+        open_api_schema = _openapi_with_response(
+            {
+                "type": "object",
+                "properties": {"name": {"type": "string", "pattern": "^\\p{L}+$"}},
+            }
+        )
+        execution_server._build_fast_response_check.cache_clear()
+
+        er_msgs = [
+            execution_server.validate_response_schema({"id": 1}, open_api_schema)
+            for _ in range(2)
+        ]
+
+        assert er_msgs == [[], []]
+        cache_info = execution_server._build_fast_response_check.cache_info()
+        assert (cache_info.misses, cache_info.hits) == (1, 1)
+
+    def test_attached_schema_key_skips_serialization(self) -> None:
+        """Test the key attached at parse time is used without re-serializing"""
+        from plugin.link.service.community.tools.http import execution_server
+
+        schema = {"type": "object", "properties": {"count": {"type": "integer"}}}
+        tool_id_schema: dict[str, Any] = {
+            "operation_ids": ["op", "bare"],
+            "op": {"response_schema": schema},
+            "bare": {},
+        }
+        execution_server.attach_response_schema_keys(tool_id_schema)
+        schema_key = tool_id_schema["op"]["_response_schema_key"]
+
+        with patch.object(execution_server, "_response_schema_key") as mock_key:
+            er_msgs = execution_server.validate_response_schema(
+                {"count": "x"}, None, schema, schema_key
+            )
+
+        mock_key.assert_not_called()
+        assert len(er_msgs) == 1
+        assert schema_key == execution_server._response_schema_key(schema)
+        assert "_response_schema_key" not in tool_id_schema["bare"]
+
+    def test_validate_response_schema_fills_null_defaults(self) -> None:
+        """Test null fields are replaced with per-type defaults in place"""
+        from plugin.link.service.community.tools.http.execution_server import (
+            validate_response_schema,
+        )
+
+        open_api_schema = _openapi_with_response(
+            {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "items": {"type": "array", "items": {"type": "object"}},
+                },
+            }
+        )
+        result_json = {"name": None, "items": [None, None]}
+
+        er_msgs = validate_response_schema(result_json, open_api_schema)
+
+        assert er_msgs == []
+        assert result_json["name"] == ""
+        assert result_json["items"] == [{}, {}]
+        assert result_json["items"][0] is not result_json["items"][1]
+
+
+@pytest.mark.unit
+class TestRespondWithTelemetry:
+    """Test class for the shared response and telemetry builder"""
+
+    def test_trace_is_not_built_when_otlp_disabled(self) -> None:
+        """Test the node trace supplier is untouched without OTLP"""
+        from plugin.link.service.community.tools.http import execution_server
+
+        supplier = Mock()
+        span = Mock(sid="sid-1")
+
+        with patch.object(
+            execution_server.const, "is_otlp_enabled", return_value=False
+        ):
+            response = asyncio.run(
+                execution_server.handle_success_response(
+                    "ok", span, supplier, Mock(), "tool@1", "third"
+                )
+            )
+
+        supplier.assert_not_called()
+        assert response.header.code == 0
+        assert response.header.sid == "sid-1"
+        assert response.payload == {"text": {"text": "ok"}}
+
+    def test_success_is_counted_as_success(self) -> None:
+        """Test successful responses use the success counter"""
+        from plugin.link.service.community.tools.http import execution_server
+
+        meter = Mock()
+
+        with patch.object(
+            execution_server.const, "is_otlp_enabled", return_value=True
+        ), patch.object(execution_server, "send_telemetry"):
+            asyncio.run(
+                execution_server.handle_success_response(
+                    "ok", Mock(sid="sid-1"), Mock, meter, "tool@1", "third"
+                )
+            )
+
+        meter.in_success_count.assert_called_once_with()
+        meter.in_error_count.assert_not_called()
+
+    def test_error_trace_records_tool_and_status(self) -> None:
+        """Test error responses report the tool, caller and status"""
+        from plugin.link.service.community.tools.http import execution_server
+        from plugin.link.utils.errors.code import ErrCode
+
+        node_trace = Mock()
+        meter = Mock()
+        span = Mock(sid="sid-1")
+
+        with patch.object(
+            execution_server.const, "is_otlp_enabled", return_value=True
+        ), patch.object(execution_server, "send_telemetry") as mock_send:
+            response = asyncio.run(
+                execution_server.handle_custom_error(
+                    ErrCode.TOOL_NOT_EXIST_ERR,
+                    "missing",
+                    span,
+                    lambda: node_trace,
+                    meter,
+                    "tool@1",
+                    "third",
+                )
+            )
+
+        meter.in_error_count.assert_called_once_with(ErrCode.TOOL_NOT_EXIST_ERR.code)
+        mock_send.assert_called_once_with(node_trace)
+        assert node_trace.service_id == "tool@1"
+        assert node_trace.log_caller == "third"
+        assert node_trace.status.code == ErrCode.TOOL_NOT_EXIST_ERR.code
+        assert response.header.message == "missing"
+
+
+@pytest.mark.unit
+class TestDumpsResult:
+    """Test class for tool response serialization"""
+
+    def test_dumps_result_keeps_unicode_and_wide_integers(self) -> None:
+        """Test non-ASCII text is kept and 128-bit integers are not rejected"""
+        from plugin.link.service.community.tools.http.execution_server import (
+            dumps_result,
+        )
+
+        assert json.loads(dumps_result({"text": "你好"})) == {"text": "你好"}
+        assert "你好" in dumps_result({"text": "你好"})
+        assert json.loads(dumps_result({"id": 2**100})) == {"id": 2**100}
+
+    def test_message_params_keep_wide_integers(self) -> None:
+        """Test decoded message fields keep integers wider than 64 bits"""
+        import base64
+
+        from plugin.link.service.community.tools.http.execution_server import (
+            process_message_params,
+        )
+
+        body = base64.b64encode(b'{"id": 123456789012345678901234567890}').decode()
+        _, _, _, decoded = process_message_params({"body": body})
+
+        assert decoded == {"id": 123456789012345678901234567890}
+
+
+@pytest.mark.unit
+class TestAuthPlan:
+    """Test class for precomputed operation authentication"""
+
+    def test_attached_plan_adds_api_key_to_query(self) -> None:
+        """Test the plan attached at parse time drives request authentication"""
+        from plugin.link.service.community.tools.http.execution_server import (
+            attach_auth_plans,
+            process_authentication,
+        )
+
+        tool_id_schema = {
+            "operation_ids": ["op"],
+            "op": {
+                "security": {
+                    "ApiKeyAuth": {
+                        "type": "apiKey",
+                        "in": "query",
+                        "name": "key",
+                        "x-value": "secret",
+                    }
+                },
+                "security_type": "ApiKeyAuth",
+            },
+        }
+        attach_auth_plans(tool_id_schema)
+        header: dict[str, Any] = {}
+        query: dict[str, Any] = {}
+
+        process_authentication(tool_id_schema["op"], header, query, "tool@1")
+
+        assert header == {}
+        assert query == {"key": "secret"}
+
+    def test_missing_security_type_raises(self) -> None:
+        """Test unknown security types keep raising the auth type error"""
+        from plugin.link.service.community.tools.http.execution_server import (
+            process_authentication,
+        )
+
+        operation_id_schema = {
+            "security": {"Other": {}},
+            "security_type": "ApiKeyAuth",
+        }
+
+        with pytest.raises(Exception, match="Security type ApiKeyAuth"):
+            process_authentication(operation_id_schema, {}, {}, "tool@1")
+
+
+@pytest.mark.unit
+class TestToolSchemaCache:
+    """Test class for the parsed tool schema cache"""
+
+    @patch(
+        "plugin.link.service.community.tools.http.execution_server.OpenapiSchemaParser"
+    )
+    @patch(
+        "plugin.link.service.community.tools.http.execution_server.ToolCrudOperation"
+    )
+    @patch("plugin.link.service.community.tools.http.execution_server.get_db_engine")
+    def test_get_tool_schema_uses_cache_until_invalidated(
+        self, mock_engine: Any, mock_crud: Any, mock_parser: Any
+    ) -> None:
+        """Test repeated lookups skip the database until the tool is invalidated"""
+        from plugin.link.service.community.tools.http import execution_server
+        from plugin.link.service.community.tools.http.schema_cache import (
+            invalidate_tool_schema,
+        )
+
+        query_result = Mock()
+        query_result.dict.return_value = {
+            "tool_id": "tool@cache",
+            "open_api_schema": json.dumps({"info": {}}),
+        }
+        mock_crud.return_value.get_tools.return_value = [query_result]
+        mock_parser.return_value.schema_parser.return_value = {
+            "op_a": {"method": "get"},
+            "op_b": {"method": "post"},
+        }
+        run_params = {"header": {"app_id": "app"}}
+        span = Mock()
+
+        first = execution_server.get_tool_schema(
+            run_params, "tool@cache", "op_a", "V1.0", span
+        )
+        second = execution_server.get_tool_schema(
+            run_params, "tool@cache", "op_b", "V1.0", span
+        )
+
+        assert first[0] == {"method": "get"}
+        assert second[0] == {"method": "post"}
+        assert mock_crud.return_value.get_tools.call_count == 1
+
+        invalidate_tool_schema("tool@cache")
+        execution_server.get_tool_schema(run_params, "tool@cache", "op_a", "V1.0", span)
+
+        assert mock_crud.return_value.get_tools.call_count == 2
+
+    @patch(
+        "plugin.link.service.community.tools.http.execution_server.OpenapiSchemaParser"
+    )
+    @patch(
+        "plugin.link.service.community.tools.http.execution_server.ToolCrudOperation"
+    )
+    @patch("plugin.link.service.community.tools.http.execution_server.get_db_engine")
+    def test_failed_parse_is_not_cached(
+        self, mock_engine: Any, mock_crud: Any, mock_parser: Any
+    ) -> None:
+        """Test an unparsable schema reports no operation and is looked up again"""
+        from plugin.link.service.community.tools.http import execution_server
+
+        query_result = Mock()
+        query_result.dict.return_value = {
+            "tool_id": "tool@broken",
+            "open_api_schema": json.dumps({"info": {}}),
+        }
+        mock_crud.return_value.get_tools.return_value = [query_result]
+        mock_parser.return_value.schema_parser.return_value = None
+        run_params = {"header": {"app_id": "app"}}
+
+        for _ in range(2):
+            operation_id_schema, _, _ = execution_server.get_tool_schema(
+                run_params, "tool@broken", "op_a", "V1.0", Mock()
+            )
+            assert operation_id_schema == ""
+
+        assert mock_crud.return_value.get_tools.call_count == 2
+
+
+@pytest.mark.unit
+class TestTelemetryBatcher:
+    """Test class for batched Kafka telemetry"""
+
+    @patch(
+        "plugin.link.service.community.tools.http.telemetry_batcher."
+        "get_kafka_producer_service"
+    )
+    def test_submitted_traces_are_sent_in_one_batch(self, mock_get_kafka: Any) -> None:
+        """Test traces queued together are flushed with a single batch send"""
+        from plugin.link.service.community.tools.http.telemetry_batcher import (
+            TelemetryBatcher,
+        )
+
+        batcher = TelemetryBatcher(linger=0.01)
+
+        async def submit_all() -> None:
+            for i in range(3):
+                batcher.submit("topic", f"trace-{i}")
+            await asyncio.sleep(0.1)
+
+        asyncio.run(submit_all())
+
+        mock_get_kafka.return_value.send_batch.assert_called_once_with(
+            "topic", ["trace-0", "trace-1", "trace-2"]
+        )
+
+    @patch(
+        "plugin.link.service.community.tools.http.telemetry_batcher."
+        "get_kafka_producer_service"
+    )
+    def test_node_traces_are_serialized_by_the_flusher(
+        self, mock_get_kafka: Any
+    ) -> None:
+        """Test submitted node traces are sent as their JSON form"""
+        from plugin.link.service.community.tools.http.telemetry_batcher import (
+            TelemetryBatcher,
+        )
+
+        node_trace = Mock()
+        node_trace.to_json.return_value = "trace-json"
+        batcher = TelemetryBatcher()
+
+        async def submit() -> None:
+            batcher.submit("topic", node_trace)
+            node_trace.to_json.assert_not_called()
+
+        asyncio.run(submit())
+        batcher.drain()
+
+        mock_get_kafka.return_value.send_batch.assert_called_once_with(
+            "topic", ["trace-json"]
+        )
+
+    @patch(
+        "plugin.link.service.community.tools.http.telemetry_batcher."
+        "get_kafka_producer_service",
+        side_effect=RuntimeError("no producer"),
+    )
+    def test_missing_producer_does_not_raise(self, mock_get_kafka: Any) -> None:
+        """Test a failing producer lookup is logged instead of raised"""
+        from plugin.link.service.community.tools.http.telemetry_batcher import (
+            TelemetryBatcher,
+        )
+
+        TelemetryBatcher._send([("topic", "trace")])
+
+        mock_get_kafka.assert_called_once()
+
+    @patch(
+        "plugin.link.service.community.tools.http.telemetry_batcher."
+        "get_kafka_producer_service"
+    )
+    def test_full_queue_drops_traces(self, mock_get_kafka: Any) -> None:
+        """Test traces beyond the queue size are dropped and the rest flushed"""
+        from plugin.link.service.community.tools.http.telemetry_batcher import (
+            TelemetryBatcher,
+        )
+
+        batcher = TelemetryBatcher(maxsize=2)
+
+        async def submit_all() -> None:
+            for i in range(3):
+                batcher.submit("topic", f"trace-{i}")
+
+        asyncio.run(submit_all())
+        batcher.drain()
+
+        mock_get_kafka.return_value.send_batch.assert_called_once_with(
+            "topic", ["trace-0", "trace-1"]
+        )
+
+    @patch(
+        "plugin.link.service.community.tools.http.telemetry_batcher."
+        "get_kafka_producer_service"
+    )
+    def test_close_flushes_pending_traces(self, mock_get_kafka: Any) -> None:
+        """Test closing the batcher sends traces still waiting to be flushed"""
+        from plugin.link.service.community.tools.http.telemetry_batcher import (
+            TelemetryBatcher,
+        )
+
+        batcher = TelemetryBatcher(linger=10)
+
+        async def submit_and_close() -> None:
+            batcher.submit("topic", "trace-0")
+            await asyncio.sleep(0)
+            batcher.submit("topic", "trace-1")
+            await batcher.close()
+
+        asyncio.run(submit_and_close())
+
+        mock_get_kafka.return_value.send_batch.assert_called_once_with(
+            "topic", ["trace-0", "trace-1"]
+        )
+
+    @patch(
+        "plugin.link.service.community.tools.http.telemetry_batcher."
+        "get_kafka_producer_service"
+    )
+    def test_close_sends_off_the_event_loop(self, mock_get_kafka: Any) -> None:
+        """Test traces held by a cancelled flusher are sent from a worker thread"""
+        import threading
+
+        from plugin.link.service.community.tools.http.telemetry_batcher import (
+            TelemetryBatcher,
+        )
+
+        batcher = TelemetryBatcher(linger=10)
+        send_threads = []
+        mock_get_kafka.return_value.send_batch.side_effect = (
+            lambda *_: send_threads.append(threading.get_ident())
+        )
+
+        async def submit_and_close() -> None:
+            batcher.submit("topic", "trace-0")
+            await asyncio.sleep(0)
+            await batcher.close()
+
+        asyncio.run(submit_and_close())
+
+        assert send_threads and send_threads[0] != threading.get_ident()
@@ -0,0 +1,636 @@
+"""
+Unit tests for the MCP server service
+Tests tool listing across multiple MCP servers
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from typing import Any, AsyncIterator
+from unittest.mock import Mock, patch
+
+import anyio
+import pytest
+from plugin.link.api.schemas.community.tools.mcp.mcp_tools_schema import (
+    MCPBatchCallToolRequest,
+    MCPItemInfo,
+    MCPToolListRequest,
+)
+from plugin.link.service.community.tools.mcp import mcp_server
+from plugin.link.service.community.tools.mcp.session_pool import SessionOpenError
+from plugin.link.utils.errors.code import ErrCode
+from pydantic import ValidationError
+
+
+@pytest.mark.unit
+class TestToolList:
+    """Test class for the tool_list service"""
+
+    def test_servers_are_processed_concurrently(self) -> None:
+        """Test every server is contacted at once and results keep request order"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_process(url: str) -> MCPItemInfo:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if url == "http://bad":
+                raise RuntimeError("boom")
+            return MCPItemInfo(
+                server_url=url, server_status=0, server_message="ok", tools=[]
+            )
+
+        request = MCPToolListRequest(
+            mcp_server_urls=["http://a", " ", "http://bad", "http://c"]
+        )
+        with patch.object(
+            mcp_server, "_process_mcp_server_by_url", side_effect=fake_process
+        ):
+            result: Any = asyncio.run(mcp_server.tool_list(list_info=request))
+
+        servers = json.loads(result.body)["data"]["servers"]
+        assert peak == 3
+        assert [s["server_url"] for s in servers] == [
+            "http://a",
+            "http://bad",
+            "http://c",
+        ]
+        assert servers[1]["server_status"] == ErrCode.MCP_SERVER_CONNECT_ERR.code
+        assert servers[0]["server_status"] == 0
+
+    def test_response_is_serialized_once_and_reused_for_tracing(self) -> None:
+        """Test the span event carries the exact body returned to the caller"""
+        from plugin.link.api.schemas.community.tools.mcp.mcp_tools_schema import (
+            MCPToolListResponse,
+        )
+
+        request = MCPToolListRequest(mcp_server_urls=[])
+        with patch.object(
+            mcp_server.Span, "add_info_events"
+        ) as mock_events, patch.object(
+            MCPToolListResponse, "model_dump_json"
+        ) as mock_dump_json:
+            result: Any = asyncio.run(mcp_server.tool_list(list_info=request))
+
+        mock_dump_json.assert_not_called()
+        assert mock_events.call_args_list[-1].args[0] == {
+            "tool_list_result": result.body.decode()
+        }
+        assert result.media_type == "application/json"
+        assert "null" not in result.body.decode()
+
+    def test_trace_is_queued_instead_of_sent_inline(self) -> None:
+        """Test the success trace goes to the telemetry batcher, not Kafka"""
+        request = MCPToolListRequest(mcp_server_urls=[])
+        with patch.object(
+            mcp_server.const, "is_otlp_enabled", return_value=True
+        ), patch.object(mcp_server, "Meter"), patch.object(
+            mcp_server.telemetry_batcher, "submit"
+        ) as mock_submit:
+            asyncio.run(mcp_server.tool_list(list_info=request))
+
+        mock_submit.assert_called_once()
+        trace = mock_submit.call_args.args[1]
+        assert trace.service_id == "tool_list"
+        assert json.loads(trace.to_json())["caller"] == "tool_list"
+
+
+class _FakeClientSession:
+    """Stand-in for mcp.ClientSession recording initialize calls"""
+
+    instances: list["_FakeClientSession"] = []
+
+    def __init__(self, read: Any, write: Any, **kwargs: Any) -> None:
+        self.read = read
+        self.kwargs = kwargs
+        self.initialized = 0
+        self.exited = False
+        _FakeClientSession.instances.append(self)
+
+    async def __aenter__(self) -> "_FakeClientSession":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self.exited = True
+
+    async def initialize(self) -> None:
+        self.initialized += 1
+
+
+# Server ends of the fake SSE read streams, closed to simulate a dropped stream
+_sse_writers: list[Any] = []
+
+
+@asynccontextmanager
+async def _fake_sse_client(url: str) -> AsyncIterator[tuple[Any, Any]]:
+    writer, read = anyio.create_memory_object_stream(0)
+    _sse_writers.append(writer)
+    async with writer, read:
+        yield (read, None)
+
+
+@pytest.mark.unit
+class TestMCPSessionPool:
+    """Test class for pooled MCP client sessions"""
+
+    def setup_method(self) -> None:
+        _FakeClientSession.instances = []
+
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.ClientSession",
+        _FakeClientSession,
+    )
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.sse_client",
+        _fake_sse_client,
+    )
+    def test_session_is_reused_until_idle(self) -> None:
+        """Test repeated calls share one session which is closed once idle"""
+        from plugin.link.service.community.tools.mcp.session_pool import MCPSessionPool
+
+        pool = MCPSessionPool(idle_seconds=0.05)
+
+        async def use_pool() -> tuple[Any, Any]:
+            async with pool.session("http://a") as first:
+                pass
+            async with pool.session("http://a") as second:
+                pass
+            await asyncio.sleep(0.2)
+            await pool.close()
+            return first, second
+
+        first, second = asyncio.run(use_pool())
+
+        assert first is second
+        assert first.initialized == 1
+        assert first.exited
+        assert len(_FakeClientSession.instances) == 1
+
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.ClientSession",
+        _FakeClientSession,
+    )
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.sse_client",
+        _fake_sse_client,
+    )
+    def test_initialize_failure_reports_stage(self) -> None:
+        """Test a failed handshake raises with its stage and is not pooled"""
+        from plugin.link.service.community.tools.mcp.session_pool import (
+            MCPSessionPool,
+            SessionOpenError,
+        )
+
+        pool = MCPSessionPool()
+
+        async def use_pool() -> str:
+            try:
+                async with pool.session("http://a"):
+                    pass
+            except SessionOpenError as err:
+                stage = err.stage
+            async with pool.session("http://a"):
+                pass
+            await pool.close()
+            return stage
+
+        with patch.object(
+            _FakeClientSession, "initialize", side_effect=[RuntimeError("x"), None]
+        ):
+            stage = asyncio.run(use_pool())
+
+        assert stage == "initialize"
+        assert len(_FakeClientSession.instances) == 2
+
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.ClientSession",
+        _FakeClientSession,
+    )
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.sse_client",
+        _fake_sse_client,
+    )
+    def test_failed_call_and_dropped_stream_retire_session(self) -> None:
+        """Test a failing call or an ended SSE stream opens a fresh session"""
+        from plugin.link.service.community.tools.mcp.session_pool import MCPSessionPool
+
+        pool = MCPSessionPool()
+
+        async def use_pool() -> None:
+            with pytest.raises(RuntimeError):
+                async with pool.session("http://a"):
+                    raise RuntimeError("call failed")
+            async with pool.session("http://a"):
+                pass
+            await _sse_writers[-1].aclose()
+            async with pool.session("http://a"):
+                pass
+            await asyncio.sleep(0)
+            await pool.close()
+
+        asyncio.run(use_pool())
+
+        assert len(_FakeClientSession.instances) == 3
+        assert all(session.exited for session in _FakeClientSession.instances)
+
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.ClientSession",
+        _FakeClientSession,
+    )
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.sse_client",
+        _fake_sse_client,
+    )
+    def test_error_reply_keeps_session_and_timeout_retires(self) -> None:
+        """Test an MCP error reply keeps the session while a timeout retires it"""
+        from mcp.shared.exceptions import McpError
+        from mcp.types import INVALID_PARAMS, ErrorData
+        from plugin.link.service.community.tools.mcp.session_pool import MCPSessionPool
+
+        pool = MCPSessionPool()
+
+        async def use_pool() -> None:
+            for code in (INVALID_PARAMS, 408):
+                with pytest.raises(McpError):
+                    async with pool.session("http://a"):
+                        raise McpError(ErrorData(code=code, message="failed"))
+            async with pool.session("http://a"):
+                pass
+            await pool.close()
+
+        with patch("plugin.link.consts.const.get_env", return_value="bad"):
+            asyncio.run(use_pool())
+
+        first, second = _FakeClientSession.instances
+        assert first.exited and second.exited
+        assert first.kwargs["read_timeout_seconds"] == timedelta(seconds=300)
+
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.ClientSession",
+        _FakeClientSession,
+    )
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.sse_client",
+        _fake_sse_client,
+    )
+    def test_pool_size_and_request_limits(self) -> None:
+        """Test the least recently used URL is evicted and sessions recycle"""
+        from plugin.link.service.community.tools.mcp.session_pool import MCPSessionPool
+
+        pool = MCPSessionPool(max_size=1, max_requests=2)
+
+        async def use_pool() -> None:
+            for url in ("http://a", "http://a", "http://a", "http://b"):
+                async with pool.session(url):
+                    pass
+            await asyncio.sleep(0)
+            await pool.close()
+
+        asyncio.run(use_pool())
+
+        first, second, third = _FakeClientSession.instances
+        assert first.exited and second.exited and third.exited
+
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.ClientSession",
+        _FakeClientSession,
+    )
+    @patch(
+        "plugin.link.service.community.tools.mcp.session_pool.sse_client",
+        _fake_sse_client,
+    )
+    def test_reaper_keeps_session_reopened_while_closing(self) -> None:
+        """Test a session opened while the reaper closes another stays pooled"""
+        from plugin.link.service.community.tools.mcp.session_pool import MCPSessionPool
+
+        pool = MCPSessionPool()
+
+        async def use_pool() -> tuple[Any, Any]:
+            async with pool.session("http://a"):
+                pass
+            async with pool.session("http://b") as old_b:
+                pass
+            for entry in pool._sessions.values():
+                entry.last_used -= 1000
+            entry_a = pool._sessions["http://a"]
+            close_a = entry_a.close
+            reopened = []
+
+            async def close_and_reopen_b() -> None:
+                await close_a()
+                async with pool.session("http://b") as new_b:
+                    reopened.append(new_b)
+
+            entry_a.close = close_and_reopen_b  # type: ignore[method-assign]
+            await pool._reap_once()
+            pooled_b = await pool._sessions["http://b"].ready
+            await pool.close()
+            return old_b, (reopened[0], pooled_b)
+
+        old_b, (new_b, pooled_b) = asyncio.run(use_pool())
+
+        assert new_b is not old_b
+        assert pooled_b is new_b
+        assert old_b.exited
+
+
+def _call_result(text: str) -> Any:
+    from mcp.types import CallToolResult, TextContent
+
+    return CallToolResult(content=[TextContent(type="text", text=text)])
+
+
+@pytest.mark.unit
+class TestBatchCallTool:
+    """Test class for the batch_call_tool service"""
+
+    @staticmethod
+    def _run_batch(
+        request: Any, fail_tool: str = "", fail_url: str = ""
+    ) -> tuple[Any, list[str], int]:
+        opened: list[str] = []
+        open_now = 0
+        open_max = 0
+
+        class _Session:
+            async def call_tool(self, name: str, arguments: Any) -> Any:
+                await asyncio.sleep(0.01)
+                if name == fail_tool:
+                    raise RuntimeError("boom")
+                return _call_result(name)
+
+        @asynccontextmanager
+        async def fake_session(url: str) -> AsyncIterator[_Session]:
+            nonlocal open_now, open_max
+            opened.append(url)
+            if url == fail_url:
+                raise SessionOpenError("connect")
+            open_now += 1
+            open_max = max(open_max, open_now)
+            try:
+                yield _Session()
+            finally:
+                open_now -= 1
+
+        async def fake_validate(call_info: Any, *args: Any) -> tuple[ErrCode, str]:
+            if call_info.mcp_server_url == "http://blocked":
+                return ErrCode.MCP_SERVER_BLACKLIST_URL_ERR, ""
+            return ErrCode.SUCCESSES, call_info.mcp_server_url
+
+        with patch.object(
+            mcp_server.mcp_session_pool, "session", side_effect=fake_session
+        ), patch.object(mcp_server, "_validate_and_get_url", side_effect=fake_validate):
+            response = asyncio.run(mcp_server.batch_call_tool(batch_info=request))
+        return json.loads(response.body), opened, open_max
+
+    def test_results_keep_request_order(self) -> None:
+        """Test each call gets its own result slot in request order"""
+        request = MCPBatchCallToolRequest.model_validate(
+            {
+                "calls": [
+                    {"mcp_server_url": "http://a", "tool_name": "one"},
+                    {"mcp_server_url": "http://blocked", "tool_name": "two"},
+                    {"mcp_server_url": "http://a", "tool_name": "three"},
+                ]
+            }
+        )
+
+        body, opened, _ = self._run_batch(request)
+
+        results = body["data"]["results"]
+        assert opened == ["http://a", "http://a"]
+        assert [r["code"] for r in results] == [
+            0,
+            ErrCode.MCP_SERVER_BLACKLIST_URL_ERR.code,
+            0,
+        ]
+        assert results[0]["data"]["content"][0]["text"] == "one"
+        assert results[2]["data"]["content"][0]["text"] == "three"
+
+    def test_max_concurrent_bounds_session_opens(self) -> None:
+        """Test sessions for distinct servers are opened under the semaphore"""
+        request = MCPBatchCallToolRequest.model_validate(
+            {
+                "calls": [
+                    {"mcp_server_url": f"http://s{i}", "tool_name": "t"}
+                    for i in range(6)
+                ],
+                "max_concurrent": 2,
+            }
+        )
+
+        body, opened, open_max = self._run_batch(request)
+
+        assert len(opened) == 6
+        assert open_max == 2
+        assert all(r["code"] == 0 for r in body["data"]["results"])
+
+    def test_calls_are_capped(self) -> None:
+        """Test a batch with more calls than allowed is rejected"""
+        with pytest.raises(ValidationError):
+            MCPBatchCallToolRequest.model_validate(
+                {"calls": [{"mcp_server_url": "http://a", "tool_name": "t"}] * 65}
+            )
+
+    def test_failed_calls_are_reported_per_call(self) -> None:
+        """Test resolution, call and open failures are traced once per call"""
+        request = MCPBatchCallToolRequest.model_validate(
+            {
+                "calls": [
+                    {"mcp_server_url": "http://blocked", "tool_name": "z"},
+                    {"mcp_server_url": "http://a", "tool_name": "bad"},
+                    {"mcp_server_url": "http://down", "tool_name": "x"},
+                    {"mcp_server_url": "http://down", "tool_name": "y"},
+                ],
+                "max_concurrent": 1,
+            }
+        )
+
+        with patch.object(
+            mcp_server.const, "is_otlp_enabled", return_value=True
+        ), patch.object(mcp_server, "Meter"), patch.object(
+            mcp_server, "_log_error_to_kafka"
+        ) as mock_log, patch.object(
+            mcp_server, "_send_node_trace"
+        ):
+            body, opened, _ = self._run_batch(
+                request, fail_tool="bad", fail_url="http://down"
+            )
+
+        assert opened == ["http://a", "http://down"]
+        assert [r["code"] for r in body["data"]["results"]] == [
+            ErrCode.MCP_SERVER_BLACKLIST_URL_ERR.code,
+            ErrCode.MCP_SERVER_CALL_TOOL_ERR.code,
+            ErrCode.MCP_SERVER_CONNECT_ERR.code,
+            ErrCode.MCP_SERVER_CONNECT_ERR.code,
+        ]
+        # The resolution failure was already counted while resolving the URL
+        assert [(c.args[0], c.args[4]) for c in mock_log.call_args_list] == [
+            (ErrCode.MCP_SERVER_BLACKLIST_URL_ERR, False),
+            (ErrCode.MCP_SERVER_CALL_TOOL_ERR, True),
+            (ErrCode.MCP_SERVER_CONNECT_ERR, True),
+            (ErrCode.MCP_SERVER_CONNECT_ERR, True),
+        ]
+
+    def test_stop_on_error_skips_remaining_calls(self) -> None:
+        """Test calls not yet started after a failure are skipped"""
+        request = MCPBatchCallToolRequest.model_validate(
+            {
+                "calls": [
+                    {"mcp_server_url": "http://a", "tool_name": "bad"},
+                    {"mcp_server_url": "http://a", "tool_name": "next"},
+                ],
+                "max_concurrent": 1,
+                "stop_on_error": True,
+            }
+        )
+
+        body, _, _ = self._run_batch(request, fail_tool="bad")
+
+        assert [r["code"] for r in body["data"]["results"]] == [
+            ErrCode.MCP_SERVER_CALL_TOOL_ERR.code,
+            ErrCode.MCP_SERVER_CALL_TOOL_SKIPPED_ERR.code,
+        ]
+
+
+@pytest.mark.unit
+class TestConnectAndGetTools:
+    """Test class for listing tools from a single MCP server"""
+
+    @patch(
+        "plugin.link.service.community.tools.mcp.mcp_server.sse_client",
+        _fake_sse_client,
+    )
+    def test_tools_are_read_from_list_tools_result(self) -> None:
+        """Test each listed tool is reported with its name, description and schema"""
+        from mcp.types import ListToolsResult, Tool
+
+        tools_result = ListToolsResult(
+            tools=[
+                Tool(
+                    name="search", description="Search", inputSchema={"type": "object"}
+                ),
+                Tool(name="plain", inputSchema={}),
+            ]
+        )
+
+        class _Session(_FakeClientSession):
+            async def list_tools(self) -> ListToolsResult:
+                return tools_result
+
+        with patch.object(mcp_server, "ClientSession", _Session):
+            item = asyncio.run(
+                mcp_server._connect_and_get_tools("http://a", server_url="http://a")
+            )
+
+        assert item.server_status == ErrCode.SUCCESSES.code
+        assert item.model_dump(exclude_none=True)["tools"] == [
+            {
+                "name": "search",
+                "description": "Search",
+                "inputSchema": {"type": "object"},
+            },
+            {"name": "plain", "inputSchema": {}},
+        ]
+
+    @patch(
+        "plugin.link.service.community.tools.mcp.mcp_server.sse_client",
+        _fake_sse_client,
+    )
+    def test_failure_is_reported_for_its_stage(self) -> None:
+        """Test initialize and list_tools failures map to their error codes"""
+
+        class _Session(_FakeClientSession):
+            async def list_tools(self) -> Any:
+                raise RuntimeError("boom")
+
+        with patch.object(mcp_server, "ClientSession", _Session):
+            list_item = asyncio.run(mcp_server._connect_and_get_tools("http://a"))
+            with patch.object(_Session, "initialize", side_effect=RuntimeError):
+                init_item = asyncio.run(mcp_server._connect_and_get_tools("http://a"))
+
+        assert list_item.server_status == ErrCode.MCP_SERVER_TOOL_LIST_ERR.code
+        assert init_item.server_status == ErrCode.MCP_SERVER_INITIAL_ERR.code
+        assert init_item.tools == []
+
+
+@pytest.mark.unit
+class TestMCPServerUrlCache:
+    """Test class for the MCP server URL cache"""
+
+    @patch("plugin.link.service.community.tools.mcp.mcp_server.ToolCrudOperation")
+    @patch("plugin.link.service.community.tools.mcp.mcp_server.get_db_engine")
+    def test_url_is_cached_until_invalidated(
+        self, mock_engine: Any, mock_crud: Any
+    ) -> None:
+        """Test repeated lookups skip the database until the server is invalidated"""
+        from plugin.link.service.community.tools.mcp.url_cache import (
+            invalidate_mcp_server_url,
+        )
+
+        query_result = Mock(tool_id="mcp@cache", mcp_server_url="http://mcp")
+        mock_crud.return_value.get_tools.return_value = [query_result]
+
+        first = mcp_server.get_mcp_server_url("mcp@cache", Mock())
+        second = mcp_server.get_mcp_server_url("mcp@cache", Mock())
+
+        assert first == second == (ErrCode.SUCCESSES, "http://mcp")
+        assert mock_crud.return_value.get_tools.call_count == 1
+
+        invalidate_mcp_server_url("mcp@cache")
+        mcp_server.get_mcp_server_url("mcp@cache", Mock())
+
+        assert mock_crud.return_value.get_tools.call_count == 2
+
+    @patch("plugin.link.service.community.tools.mcp.mcp_server.ToolCrudOperation")
+    @patch("plugin.link.service.community.tools.mcp.mcp_server.get_db_engine")
+    def test_failed_lookup_is_not_cached(
+        self, mock_engine: Any, mock_crud: Any
+    ) -> None:
+        """Test a server that is not found is looked up again next time"""
+        mock_crud.return_value.get_tools.return_value = []
+
+        for _ in range(2):
+            err, _url = mcp_server.get_mcp_server_url("mcp@missing", Mock())
+            assert err is ErrCode.MCP_SERVER_NOT_FOUND_ERR
+
+        assert mock_crud.return_value.get_tools.call_count == 2
+
+
+@pytest.mark.unit
+class TestCallResultContent:
+    """Test class for converting MCP call results"""
+
+    def test_text_and_image_content_are_converted(self) -> None:
+        """Test text and image items are kept and other content types dropped"""
+        from mcp.types import (
+            CallToolResult,
+            EmbeddedResource,
+            ImageContent,
+            TextContent,
+            TextResourceContents,
+        )
+
+        call_result = CallToolResult(
+            isError=False,
+            content=[
+                TextContent(type="text", text="hello"),
+                ImageContent(type="image", data="aGk=", mimeType="image/png"),
+                EmbeddedResource(
+                    type="resource",
+                    resource=TextResourceContents(uri="file:///a", text="x"),
+                ),
+            ],
+        )
+
+        is_error, content = mcp_server._call_result_content(call_result)
+
+        assert is_error is False
+        assert [item.model_dump() for item in content] == [
+            {"type": "text", "text": "hello"},
+            {"type": "image", "data": "aGk=", "mineType": "image/png"},
+        ]
@@ -408,3 +408,65 @@ class TestLoggerUtils:
         # Should add serialized data
         assert "serialized" in record["extra"]
         assert isinstance(record["extra"]["serialized"], bytes)
+
+
+@pytest.mark.unit
+class TestAccessInterceptor:
+    """Test class for URL security checks"""
+
+    def test_blacklist_is_parsed_once_and_checked_by_host(self) -> None:
+        """Test blacklisted IPs and segments match by host regardless of port"""
+        from plugin.link.utils.security import access_interceptor
+
+        env = {
+            const.IP_BLACK_LIST_KEY: "10.0.0.1",
+            const.SEGMENT_BLACK_LIST_KEY: "192.168.0.0/16",
+            const.DOMAIN_BLACK_LIST_KEY: "",
+        }
+        access_interceptor._get_blacklist_config.cache_clear()
+        access_interceptor._get_domain_black_list.cache_clear()
+        access_interceptor.is_in_blacklist.cache_clear()
+        try:
+            with patch.dict("os.environ", env):
+                assert access_interceptor.is_in_blacklist("http://10.0.0.1:8080/sse")
+                assert access_interceptor.is_in_blacklist("http://192.168.3.4/sse")
+                assert not access_interceptor.is_in_blacklist("http://10.0.0.2/sse")
+        finally:
+            access_interceptor._get_blacklist_config.cache_clear()
+            access_interceptor._get_domain_black_list.cache_clear()
+            access_interceptor.is_in_blacklist.cache_clear()
+
+    def test_is_local_url_detects_loopback(self) -> None:
+        """Test localhost and loopback addresses are reported as local"""
+        from plugin.link.utils.security.access_interceptor import is_local_url
+
+        assert is_local_url("http://localhost:8000/sse")
+        assert is_local_url("http://127.0.0.2/sse")
+        assert not is_local_url("http://example.com/sse")
+
+
+@pytest.mark.unit
+class TestConstEnv:
+    """Test class for cached environment lookups"""
+
+    def test_unset_variable_is_read_again_once_set(self) -> None:
+        """Test a miss is not cached while a set value is"""
+        key = "SPARK_LINK_TEST_LATE_ENV"
+
+        with patch.dict("os.environ", {}, clear=False):
+            assert const.get_env(key, "fallback") == "fallback"
+            with patch.dict("os.environ", {key: "loaded"}):
+                assert const.get_env(key) == "loaded"
+            assert const.get_env(key) == "loaded"
+        const._ENV_CACHE.pop(key, None)
+
+    def test_is_production_env_is_memoized(self) -> None:
+        """Test the environment check is resolved once until cleared"""
+        const.is_production_env.cache_clear()
+        try:
+            with patch.object(const, "get_env", return_value="production") as env:
+                assert const.is_production_env()
+                assert const.is_production_env()
+            env.assert_called_once_with(const.ENVIRONMENT_KEY)
+        finally:
+            const.is_production_env.cache_clear()
@@ -52,6 +52,10 @@ class ErrCode(Enum):
     MCP_SERVER_URL_EMPTY_ERR = (30708, "MCP server URL is empty")
     MCP_SERVER_LOCAL_URL_ERR = (30709, "MCP server is loopback address")
     MCP_SERVER_BLACKLIST_URL_ERR = (30710, "MCP server URL is blacklisted")
+    MCP_SERVER_CALL_TOOL_SKIPPED_ERR = (
+        30711,
+        "MCP tool call skipped after an earlier batch failure",
+    )
 
     @property
     def code(self) -> int:
@@ -329,10 +329,42 @@ class OpenapiSchemaParser:
             ),
             "security": schemas["security_info"],
             "security_type": schemas["security_type"],
+            "response_schema": self._extract_response_schema(interface),
         }
 
         return operation_id, operation_bundle
 
+    def _extract_response_schema(self, interface: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the 200 application/json response schema of an interface."""
+        return (
+            interface["operation"]
+            .get("responses", {})
+            .get("200", {})
+            .get("content", {})
+            .get("application/json", {})
+            .get("schema", {})
+        )
+
+    def find_response_schema(
+        self, server_url: str, method: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the response schema of the operation at a server URL and method.
+
+        Operations are matched on the same server_url that schema_parser
+        builds; None when the schema has no such operation.
+        """
+        openapi = self.schema
+        if not openapi.get("servers") or "paths" not in openapi:
+            return None
+        base_url = openapi["servers"][0].get("url", "")
+        for interface in self._extract_interfaces(openapi):
+            if (
+                interface["method"] == method.lower()
+                and base_url + interface["path"] == server_url
+            ):
+                return self._extract_response_schema(interface)
+        return None
+
     def schema_parser(self) -> Optional[Dict[str, Any]]:
         """
         解析 schema
@@ -1,11 +1,31 @@
+import functools
 import ipaddress
 import os
 import re
-from typing import List, Optional, Tuple
+from typing import FrozenSet, Optional, Tuple
 from urllib.parse import urlparse, urlunparse
 
 from plugin.link.consts import const
 
+IPNetwork = ipaddress.IPv4Network | ipaddress.IPv6Network
+
+# URL checks run for every MCP server a request touches; the same URLs recur
+URL_CHECK_CACHE_SIZE = 8192
+
+_HOST_PATTERN = re.compile(r"://([^/?#]+)")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_domain_black_list() -> Tuple[str, ...]:
+    """Get the lowercased domain blacklist from the environment.
+
+    Resolved on first use so configuration loaded at startup is honoured.
+    """
+    black_list_str = os.getenv(const.DOMAIN_BLACK_LIST_KEY, "")
+    if not black_list_str:
+        return ()
+    return tuple(domain.strip().lower() for domain in black_list_str.split(","))
+
 
 def is_in_black_domain(url: str) -> bool:
     """Check if URL contains any blacklisted domains.
@@ -16,42 +36,42 @@ def is_in_black_domain(url: str) -> bool:
     Returns:
         bool: True if URL contains blacklisted domain, False otherwise
     """
-    # Get environment variable and handle unset or empty cases
-    black_list_str = os.getenv(const.DOMAIN_BLACK_LIST_KEY, "")
-    if not black_list_str:
+    domain_black_list = _get_domain_black_list()
+    if not domain_black_list:
         return False
 
-    # Split blacklist string into list
-    domain_black_list = [domain.strip().lower() for domain in black_list_str.split(",")]
-
     # Convert URL to lowercase to avoid case sensitivity issues
     url_lower = url.lower()
 
     # Check if any domain in blacklist is present in URL
     for black_domain in domain_black_list:
         # Ensure matching complete domain names, not substrings
-        if black_domain.lower() in url_lower:
+        if black_domain in url_lower:
             return True
 
     return False
 
 
-def _get_blacklist_config() -> (
-    Tuple[List[ipaddress.IPv4Network | ipaddress.IPv6Network], List[str]]
-):
+@functools.lru_cache(maxsize=1)
+def _get_blacklist_config() -> Tuple[Tuple[IPNetwork, ...], FrozenSet[str]]:
     """Get blacklist configuration from environment variables.
 
+    Parsed once on first use; call ``_get_blacklist_config.cache_clear()``
+    after changing the environment at runtime (e.g. in tests).
+
     Returns:
         tuple: (segment_black_list, ip_black_list)
     """
-    segment_black_list = []
-    for black_seg in (os.getenv(const.SEGMENT_BLACK_LIST_KEY) or "").split(","):
-        if black_seg:
-            segment_black_list.append(ipaddress.ip_network(black_seg))
-    ip_black_list = []
-    for black_id in (os.getenv(const.IP_BLACK_LIST_KEY) or "").split(","):
-        if black_id:
-            ip_black_list.append(black_id)
+    segment_black_list = tuple(
+        ipaddress.ip_network(black_seg)
+        for black_seg in (os.getenv(const.SEGMENT_BLACK_LIST_KEY) or "").split(",")
+        if black_seg
+    )
+    ip_black_list = frozenset(
+        black_id
+        for black_id in (os.getenv(const.IP_BLACK_LIST_KEY) or "").split(",")
+        if black_id
+    )
     return segment_black_list, ip_black_list
 
 
@@ -64,7 +84,7 @@ def _extract_host_from_url(url: str) -> Optional[str]:
     Returns:
         str: The host/IP, or None if not found
     """
-    match = re.search(r"://([^/?#]+)", url)
+    match = _HOST_PATTERN.search(url)
     if not match:
         return None
 
@@ -78,23 +98,22 @@ def _extract_host_from_url(url: str) -> Optional[str]:
 
 def _is_ip_blacklisted(
     ip: str,
-    ip_black_list: List[str],
-    segment_black_list: List[ipaddress.IPv4Network | ipaddress.IPv6Network],
+    ip_black_list: FrozenSet[str],
+    segment_black_list: Tuple[IPNetwork, ...],
 ) -> bool:
     """Check if IP is in blacklist or blacklisted network segments.
 
     Args:
         ip: IP address to check
-        ip_black_list: List of blacklisted IPs
-        segment_black_list: List of blacklisted network segments
+        ip_black_list: Set of blacklisted IPs
+        segment_black_list: Blacklisted network segments
 
     Returns:
         bool: True if IP is blacklisted
     """
     # Check direct IP blacklist
-    for i_ip in ip_black_list:
-        if ip == i_ip:
-            return True
+    if ip in ip_black_list:
+        return True
 
     # Check network segments
     try:
@@ -107,9 +126,12 @@ def _is_ip_blacklisted(
         return False
 
 
+@functools.lru_cache(maxsize=URL_CHECK_CACHE_SIZE)
 def is_in_blacklist(url: str) -> bool:
     """Check if URL is in security blacklist (domains, IPs, network segments).
 
+    Results are memoized per URL; the blacklists are read once at first use.
+
     Args:
         url: The URL to validate against blacklists
 
@@ -144,9 +166,12 @@ def is_in_blacklist(url: str) -> bool:
 
 
 # Check if it's a loopback address
+@functools.lru_cache(maxsize=URL_CHECK_CACHE_SIZE)
 def is_local_url(url: str) -> bool:
     """Check if URL points to a local/loopback address.
 
+    Results are memoized per URL.
+
     Args:
         url: The URL to check for local address
 